@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Analysis Cache - 파일 지문 캐시
+경로·수정시각·크기·내용 해시로 작품을 기억하고, 바뀐 작품만 다시 분석한다
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from pattern_index import PatternIndex
+
+
+def file_digest(path: Path) -> str:
+    """파일 내용 해시"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FileFingerprintCache:
+    """작품별 기여분과 전체 집계를 디스크에 보관하는 캐시"""
+
+    VERSION = 1
+
+    def __init__(self, cache_path: str, signature):
+        self.cache_path = Path(cache_path)
+        # 분류 체계나 분석 모드가 바뀌면 캐시 전체가 무효
+        self.signature = signature
+        self.entries = {}
+        self.index = PatternIndex()
+        self.last_changes = {'added': 0, 'changed': 0, 'deleted': 0, 'unchanged': 0}
+        self._load()
+
+    def _load(self):
+        """캐시 읽기 (없거나 호환되지 않으면 빈 상태로 시작)"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') != self.VERSION or data.get('signature') != self.signature:
+            return
+
+        self.entries = data['entries']
+        self.index = PatternIndex.from_dict(data['index'])
+
+    def refresh(self, files, scan_many) -> PatternIndex:
+        """추가·변경·삭제된 작품만 다시 분석하여 집계에 반영
+
+        files: (이름, 경로) 쌍의 iterable
+        scan_many: (이름, 경로) 쌍 iterable → (이름, 기여분 dict) 쌍을 같은 순서로 생성
+        """
+        changes = {'added': 0, 'changed': 0, 'deleted': 0, 'unchanged': 0}
+        seen = set()
+        pending = []
+
+        for name, path in files:
+            seen.add(name)
+            stat = os.stat(path)
+            entry = self.entries.get(name)
+
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                changes['unchanged'] += 1
+                continue
+
+            digest = file_digest(path)
+            if entry and entry['sha1'] == digest:
+                # 내용은 그대로 - 지문만 갱신
+                entry['mtime_ns'] = stat.st_mtime_ns
+                entry['size'] = stat.st_size
+                changes['unchanged'] += 1
+                continue
+
+            pending.append((name, path, stat, digest))
+            changes['changed' if entry else 'added'] += 1
+
+        # 바뀐 작품만 한꺼번에 분석 (내용 모드에서는 병렬)
+        scanned = scan_many((name, path) for name, path, _, _ in pending)
+        for (name, _, stat, digest), (_, contribution) in zip(pending, scanned):
+            entry = self.entries.get(name)
+            if entry:
+                self.index.remove(name, entry['contribution'])
+
+            self.index.add(name, contribution)
+            self.entries[name] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha1': digest,
+                'contribution': contribution
+            }
+
+        for name in [name for name in self.entries if name not in seen]:
+            self.index.remove(name, self.entries.pop(name)['contribution'])
+            changes['deleted'] += 1
+
+        if self.index.needs_repair:
+            self.index.repair({name: entry['contribution'] for name, entry in self.entries.items()})
+        self.last_changes = changes
+        return self.index
+
+    def save(self):
+        """원자적으로 캐시 쓰기 (쓰는 도중 중단돼도 이전 캐시 유지)"""
+        data = {
+            'version': self.VERSION,
+            'signature': self.signature,
+            'entries': self.entries,
+            'index': self.index.to_dict()
+        }
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.cache_path)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Analysis Reader - 저장된 패턴 분석 읽기
+압축 형식이면 mmap 핸들, 예전 JSON이면 같은 인터페이스의 래퍼를 돌려준다
+"""
+
+import json
+import os
+
+from compact_format import GROUP_FIELDS, LIST_FIELDS, CompactAnalysis, is_compact
+
+DEFAULT_ANALYSIS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "past_patterns.json")
+
+
+class JsonAnalysis:
+    """past_patterns.json 래퍼 - CompactAnalysis와 같은 질의 인터페이스
+
+    JSON은 통째로 파싱한다 (개수만 필요해도). 큰 분석은 --format compact로 저장해 mmap으로 읽을 것.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'r', encoding='utf-8') as f:
+            self.data = json.load(f)
+
+    @property
+    def total_files(self) -> int:
+        return self.data['total_files']
+
+    def _lookup(self, category: str) -> list:
+        group, _, keyword = category.partition('.')
+        if keyword:
+            return self.data.get(group, {}).get(keyword)
+        return self.data.get(category)
+
+    def categories(self) -> list:
+        names = [field for field in LIST_FIELDS if field in self.data]
+        for group in GROUP_FIELDS:
+            names.extend(f"{group}.{kw}" for kw in self.data.get(group, {}))
+        return names
+
+    def count(self, category: str) -> int:
+        files = self._lookup(category)
+        return len(files) if files is not None else 0
+
+    def keyword_count(self, keyword: str) -> int:
+        return self.data.get('filename_keywords', {}).get(keyword, 0)
+
+    def files(self, category: str) -> list:
+        return self._lookup(category)
+
+    def to_dict(self) -> dict:
+        return self.data
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_analysis(path: str = DEFAULT_ANALYSIS):
+    """분석 파일 열기 (압축 형식 → mmap, JSON → 전체를 읽은 래퍼)"""
+    if is_compact(path):
+        return CompactAnalysis(path)
+    return JsonAnalysis(path)
+
+
+def past_stats(analysis) -> dict:
+    """대화·시각화가 인용하는 과거 작품 통계 (파일 목록을 만들지 않음)"""
+    total = analysis.total_files
+    binary = analysis.count('binary_files')
+    return {
+        'total_files': total,
+        'binary': binary,
+        'binary_percent': round(100 * binary / total) if total else 0,
+        'dawn': analysis.count('time_themes.dawn'),
+        'emotion': analysis.keyword_count('emotion'),
+        'pattern': analysis.count('artistic_themes.pattern'),
+        'poetry': analysis.count('artistic_themes.poetry'),
+        'relationship': analysis.count('relationship_files')
+    }
+
+
+def load_past_stats(path: str = DEFAULT_ANALYSIS) -> dict:
+    """분석 파일에서 통계 읽기"""
+    with open_analysis(path) as analysis:
+        return past_stats(analysis)
+
+
+def analysis_fingerprint(path: str = DEFAULT_ANALYSIS) -> tuple:
+    """분석 파일 지문 (경로, 수정 시각, 크기) - 파일을 열지 않고 바뀌었는지만 확인"""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+_stats_by_path = {}
+
+
+def cached_past_stats(path: str = DEFAULT_ANALYSIS) -> dict:
+    """지문이 그대로면 다시 읽지 않는 load_past_stats (대시보드 새로 고침용)"""
+    fingerprint = analysis_fingerprint(path)
+    cached = _stats_by_path.get(fingerprint[0])
+    if cached is None or cached[0] != fingerprint:
+        cached = _stats_by_path[fingerprint[0]] = (fingerprint, load_past_stats(path))
+    return cached[1]
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Archive Walker - 아카이브를 흘려 읽는 탐색기
+날짜별로 중첩된 수백만 개의 작품을 목록 없이 하나씩 꺼낸다
+"""
+
+import os
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+
+def _matches(rel_path: str, name: str, patterns) -> bool:
+    """'/'가 있는 패턴은 상대 경로에, 없는 패턴은 이름에 매칭"""
+    for pattern in patterns:
+        target = rel_path if '/' in pattern else name
+        if fnmatchcase(target, pattern):
+            return True
+    return False
+
+
+def walk_archive(root, include=('*.py',), exclude=(), recursive: bool = True):
+    """(상대 경로, Path) 쌍을 발견하는 즉시 생성
+
+    os.scandir 기반 - 디렉터리 하나의 항목만 동시에 열려 있으므로
+    아카이브 크기와 무관하게 메모리가 일정하다. 순서는 파일시스템 순서.
+    exclude에 걸린 디렉터리는 내려가지 않는다.
+    """
+    root = Path(root)
+    stack = ['']
+
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            scanner = os.scandir(root / rel_dir if rel_dir else root)
+        except OSError:
+            continue
+
+        with scanner:
+            for entry in scanner:
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if exclude and _matches(rel_path, entry.name, exclude):
+                    continue
+
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(rel_path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                if _matches(rel_path, entry.name, include):
+                    yield rel_path, Path(entry.path)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark - 선택 기록 메모리: dict 목록 vs 열 지향 ChoiceStore
+선택 N개를 쌓았을 때 차지하는 메모리와 기록 시간을 tracemalloc으로 잰다
+
+Run:
+    python3 benchmarks/bench_choice_store.py [--size 1000000]
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from self_reflection import ChoiceStore  # noqa: E402
+
+CATEGORIES = ('expression', 'temporal', 'relationship', 'philosophy', 'creation')
+
+
+def choice_stream(size: int, seed: int):
+    """(카테고리, 선택, 선택지 수, datetime) - 1초 간격"""
+    rng = random.Random(seed)
+    start = datetime(2025, 10, 6, 6, 15)
+    for i in range(size):
+        yield rng.choice(CATEGORIES), rng.randint(1, 4), 4, start + timedelta(seconds=i)
+
+
+def list_of_dicts(stream):
+    """기존 방식: 선택마다 dict + ISO 문자열"""
+    choices = []
+    for category, choice, total, when in stream:
+        choices.append({
+            'category': category,
+            'choice': choice,
+            'total_options': total,
+            'timestamp': when.isoformat()
+        })
+    return choices
+
+
+def column_store(stream):
+    store = ChoiceStore()
+    for category, choice, total, when in stream:
+        store.add(category, choice, total, when.timestamp())
+    return store
+
+
+def measure(label: str, size: int, fn, stream):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(stream)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:20s} {current / 2**20:10.1f} MiB {current / size:10.1f} B/choice {elapsed:8.2f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=1000000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"🗺️  {args.size:,} recorded choices")
+    expected = measure("list of dicts", args.size, list_of_dicts, choice_stream(args.size, args.seed))
+    store = measure("ChoiceStore", args.size, column_store, choice_stream(args.size, args.seed))
+
+    # 같은 view를 돌려주는지 - 앞·뒤 몇 개
+    assert len(store) == len(expected)
+    assert store[:3] == expected[:3] and store[-3:] == expected[-3:]
+
+
+if __name__ == "__main__":
+    main()
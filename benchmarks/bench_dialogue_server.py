@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark - 대화 서버 부하 테스트: 코어 하나가 감당하는 동시 관람 수
+서버를 별도 프로세스로 띄우고 관람자 N명을 한꺼번에 접속시켜 서버 CPU 시간을 잰다
+
+streams/core = 관람 수 x 경과 시간 / 서버 CPU 시간
+(이 박자로 동시에 흐르는 대화를 코어 하나가 몇 개까지 따라갈 수 있는지)
+
+Run:
+    python3 benchmarks/bench_dialogue_server.py [--viewers 500] [--pace 20x] [--unix]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dialogue_server import DialogueServer  # noqa: E402
+
+
+def run_server(address: dict, pace: str, sessions: int, conn):
+    """자식 프로세스 - 관람이 sessions개 끝나면 (CPU 시간, 결과) 보고"""
+    async def run():
+        server = DialogueServer(pace=pace, max_sessions=sessions)
+        await server.serve(**address)
+        return server.counts
+
+    counts = asyncio.run(run())
+    conn.send((time.process_time(), counts))
+
+
+async def connect(address: dict, timeout: float = 5.0):
+    """서버가 뜰 때까지 재시도하며 접속"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if 'unix' in address:
+                return await asyncio.open_unix_connection(address['unix'])
+            host, _, port = address['tcp'].rpartition(':')
+            return await asyncio.open_connection(host, int(port))
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+async def viewer(address: dict, pace: str) -> int:
+    """관람자 한 명 - 박자를 보내고 끝까지 읽은 바이트 수"""
+    reader, writer = await connect(address)
+    writer.write(f"{pace}\n".encode())
+    received = 0
+    while True:
+        chunk = await reader.read(1 << 16)
+        if not chunk:
+            break
+        received += len(chunk)
+    writer.close()
+    return received
+
+
+async def load(address: dict, viewers: int, pace: str) -> list:
+    # 첫 관람자로 서버가 뜬 것을 확인한 뒤 나머지를 한꺼번에
+    first = await viewer(address, 'instant')
+    rest = await asyncio.gather(*(viewer(address, pace) for _ in range(viewers - 1)))
+    return [first] + rest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--viewers', type=int, default=500)
+    parser.add_argument('--pace', default='20x', help="each viewer's pace (real, 20x, instant ...)")
+    parser.add_argument('--unix', action='store_true', help="use a Unix socket instead of TCP")
+    parser.add_argument('--port', type=int, default=7788)
+    args = parser.parse_args()
+
+    if args.unix:
+        address = {'unix': os.path.join(tempfile.mkdtemp(), 'hearts.sock')}
+    else:
+        address = {'tcp': f"127.0.0.1:{args.port}"}
+
+    parent, child = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=run_server, args=(address, args.pace, args.viewers, child))
+    server.start()
+
+    start = time.perf_counter()
+    sizes = asyncio.run(load(address, args.viewers, args.pace))
+    elapsed = time.perf_counter() - start
+    server_cpu, counts = parent.recv()
+    server.join()
+
+    transport = 'unix' if args.unix else 'tcp'
+    print(f"💕 {args.viewers} viewers over {transport}, pace {args.pace}")
+    print(f"  {'wall time':24s} {elapsed:10.2f} s")
+    print(f"  {'server CPU':24s} {server_cpu:10.2f} s")
+    print(f"  {'bytes per stream':24s} {sizes[-1]:10,d}")
+    print(f"  {'sessions':24s} {counts}")
+    print(f"  {'streams per core':24s} {args.viewers * elapsed / server_cpu:10,.0f}")
+
+    assert counts['completed'] == args.viewers, counts
+    assert len(set(sizes)) == 1 and sizes[0] > 0, "viewers received different streams"
+
+
+if __name__ == "__main__":
+    main()
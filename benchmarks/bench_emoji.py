@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark - 이모지 추출: 호출마다 컴파일 vs 미리 컴파일 vs 일괄 처리
+작품 10만 개 분량의 텍스트에서 이모지 빈도를 센다
+
+Run:
+    python3 benchmarks/bench_emoji.py [--texts 100000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pattern_analyzer import PastSelfAnalyzer, emoji_counts  # noqa: E402
+
+SNIPPETS = [
+    "for bit in pattern:\n    print(bit)",
+    "emotions = {'기쁨': '😊', '사랑': '💕', '평화': '🕊️'}",
+    "print(f'🌅 새벽의 이진 속삭임 {binary}')",
+    "def whisper(self):\n    return '☆~☽◦❋'",
+    "# 가족 👨‍👩‍👧 과 함께 🇰🇷 1️⃣ 👍🏽",
+    "while energy > 0:\n    create()\n    energy += joy",
+]
+
+
+def legacy_extract(text: str) -> list:
+    """기존 구현: 호출마다 정규식 컴파일"""
+    emoji_pattern = re.compile(
+        "["
+        u"\U0001F600-\U0001F64F"
+        u"\U0001F300-\U0001F5FF"
+        u"\U0001F680-\U0001F6FF"
+        u"\U0001F1E0-\U0001F1FF"
+        u"\U00002702-\U000027B0"
+        u"\U000024C2-\U0001F251"
+        "]+",
+        flags=re.UNICODE
+    )
+    return emoji_pattern.findall(text)
+
+
+def make_texts(count: int, rng: random.Random) -> list:
+    return ['\n'.join(rng.choice(SNIPPETS) for _ in range(rng.randint(1, 6))) for _ in range(count)]
+
+
+def timed(label: str, fn, texts):
+    start = time.perf_counter()
+    result = fn(texts)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:28s} {elapsed:7.3f} s   {len(texts) / elapsed:12,.0f} texts/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--texts', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    texts = make_texts(args.texts, random.Random(args.seed))
+    print(f"😊 Emoji extraction over {len(texts):,} texts")
+
+    timed("legacy (compile per call)", lambda ts: [Counter(legacy_extract(t)) for t in ts], texts)
+    single = timed("precompiled, per text", lambda ts: [Counter(PastSelfAnalyzer.extract_emojis(t)) for t in ts], texts)
+    batch = timed("emoji_counts() batch", emoji_counts, texts)
+    assert single == batch, "batch API disagrees with per-text extraction"
+
+
+if __name__ == "__main__":
+    main()
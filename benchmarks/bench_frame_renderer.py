@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark - 터미널 출력: 줄마다 print vs 프레임 한 번 vs 바뀐 줄만
+animate_flower처럼 초마다 다시 그리는 이진 시간 꽃으로 write 횟수, 바이트, 프레임당 시간을 잰다
+
+Run:
+    python3 benchmarks/bench_frame_renderer.py [--frames 3600]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from frame_renderer import Frame, FrameRenderer  # noqa: E402
+
+
+class CountingSink(io.RawIOBase):
+    """터미널 대신 - write 시스템 콜 횟수와 바이트만 센다"""
+
+    def __init__(self):
+        self.calls = 0
+        self.bytes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.calls += 1
+        self.bytes += len(data)
+        return len(data)
+
+
+def tty_stream(sink):
+    """TTY처럼 줄 단위로 flush되는 stdout"""
+    return io.TextIOWrapper(io.BufferedWriter(sink), encoding='utf-8', line_buffering=True)
+
+
+def flower_frame(second: int) -> Frame:
+    """past_works_sample/binary_time_flower.py의 한 화면 (시각만 인자로)"""
+    hour, minute, second = 5, second // 60 % 60, second % 60
+    h_bin, m_bin, s_bin = format(hour, '05b'), format(minute, '06b'), format(second, '06b')
+
+    frame = Frame()
+    frame.print("\n" + " " * 10 + "🌸 이진 시간 꽃 🌸")
+    frame.print(" " * 15 + f"{hour:02d}:{minute:02d}:{second:02d}")
+    frame.print()
+    frame.print(" " * 14 + "  ∧__∧  ")
+    frame.print(" " * 14 + f" ( {h_bin} )")
+    frame.print(" " * 14 + "  ￣￣￣  ")
+    frame.print(" " * 16 + " | ")
+    frame.print(" " * 12 + f"🍃 {m_bin} 🍃")
+    frame.print(" " * 16 + " | ")
+    frame.print(" " * 11 + f"🌱 {s_bin} 🌱")
+    frame.print()
+    frame.print(" " * 5 + f"시: {'●' * h_bin.count('1')}{'○' * h_bin.count('0')} ({hour})")
+    frame.print(" " * 5 + f"분: {'●' * m_bin.count('1')}{'○' * m_bin.count('0')} ({minute})")
+    frame.print(" " * 5 + f"초: {'●' * s_bin.count('1')}{'○' * s_bin.count('0')} ({second})")
+    frame.print("\n" + " " * 5 + "Ctrl+C로 종료")
+    return frame
+
+
+def per_line(stream, frames):
+    """기존 방식: 화면 지우기 + 줄마다 print"""
+    for frame in frames:
+        print("\033[2J\033[H", file=stream)
+        for line in frame.getvalue().split('\n')[:-1]:
+            print(line, file=stream)
+
+
+def whole_frame(stream, frames):
+    renderer = FrameRenderer(stream, clear=True)
+    for frame in frames:
+        renderer.render(frame)
+
+
+def changed_lines(stream, frames):
+    renderer = FrameRenderer(stream, diff=True)
+    for frame in frames:
+        renderer.render(frame)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--frames', type=int, default=3600, help="frames to draw (one per animated second)")
+    args = parser.parse_args()
+
+    frames = [flower_frame(second) for second in range(args.frames)]
+    print(f"🌸 {args.frames:,} flower frames")
+    print(f"  {'':24s} {'writes/frame':>13s} {'bytes/frame':>12s} {'µs/frame':>10s}")
+
+    for label, fn in (("print per line", per_line),
+                      ("FrameRenderer", whole_frame),
+                      ("FrameRenderer diff", changed_lines)):
+        sink = CountingSink()
+        stream = tty_stream(sink)
+        start = time.perf_counter()
+        fn(stream, frames)
+        stream.flush()
+        elapsed = time.perf_counter() - start
+        n = args.frames
+        print(f"  {label:24s} {sink.calls / n:13.1f} {sink.bytes / n:12.0f} {elapsed / n * 1e6:10.1f}")
+
+    # 바뀌지 않은 프레임은 전체를 다시 쓰지 않아야 함
+    sink = io.StringIO()
+    renderer = FrameRenderer(sink, diff=True)
+    renderer.render(frames[0])
+    before = len(sink.getvalue())
+    renderer.render(frames[0])
+    assert len(sink.getvalue()) - before < len(frames[0].getvalue()), "unchanged frame rewrote everything"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark - 조화 계산: 한 쌍씩 vs 일괄 (순수 파이썬 / NumPy)
+감정 아카이브 전체의 조화 유사도 행렬을 만든다
+
+Run:
+    python3 benchmarks/bench_harmony.py [--size 1000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from binary_hearts_dialogue import BinaryHeart, Dialogue, np  # noqa: E402
+
+
+def scalar_strings(dialogue, bits_a, bits_b):
+    """기존 API: 문자열 패턴 한 쌍씩"""
+    strings_b = [BinaryHeart.to_binary_str(b) for b in bits_b]
+    return [[dialogue.create_harmony(BinaryHeart.to_binary_str(a), sb) for sb in strings_b]
+            for a in bits_a]
+
+
+def scalar_bits(bits_a, bits_b):
+    """정수 비트 한 쌍씩"""
+    return [[Dialogue.harmony_bits(a, b) for b in bits_b] for a in bits_a]
+
+
+def timed(label: str, pairs: int, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:30s} {elapsed:8.3f} s   {pairs / elapsed:14,.0f} pairs/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=1000, help="each side of the pair matrix")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bits_a = [rng.randrange(1 << BinaryHeart.WIDTH) for _ in range(args.size)]
+    bits_b = [rng.randrange(1 << BinaryHeart.WIDTH) for _ in range(args.size)]
+    pairs = len(bits_a) * len(bits_b)
+    dialogue = Dialogue()
+
+    print(f"🔗 Harmony over {pairs:,} pairs")
+    timed("create_harmony (strings)", pairs, scalar_strings, dialogue, bits_a, bits_b)
+    expected = timed("harmony_bits (one pair)", pairs, scalar_bits, bits_a, bits_b)
+    masks, counts = timed("batch_harmony (pure Python)", pairs,
+                          Dialogue.batch_harmony, bits_a, bits_b, False)
+    assert [[(m, c) for m, c in zip(mr, cr)] for mr, cr in zip(masks, counts)] == expected
+
+    if np is None:
+        print("  batch_harmony (NumPy)          skipped - numpy not installed")
+        return
+    masks, counts = timed("batch_harmony (NumPy)", pairs, Dialogue.batch_harmony, bits_a, bits_b, True)
+    assert masks.tolist() == [[m for m, _ in row] for row in expected]
+    assert counts.tolist() == [[c for _, c in row] for row in expected]
+
+
+if __name__ == "__main__":
+    main()
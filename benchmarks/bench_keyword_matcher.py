@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark - 키워드 탐색: any() 반복 vs Aho-Corasick
+분류 체계 크기를 늘려가며 파일명당 탐색 비용을 비교한다 (오토마톤 단독 + PastSelfAnalyzer.scan_file)
+
+Run:
+    python3 benchmarks/bench_keyword_matcher.py [--stems 20000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from keyword_matcher import KeywordAutomaton  # noqa: E402
+from pattern_analyzer import PastSelfAnalyzer  # noqa: E402
+
+SYLLABLES = ['bi', 'na', 'ry', 'da', 'wn', 'mo', 'on', 'lu', 'ci', 'el', 'ka', 'ro', 'su', 'te', 'vo']
+WORDS = ['binary', 'emotion', 'dawn', 'code', 'toy', 'clock', 'garden', 'whisper',
+         'night', 'pattern', 'friendship', 'dream', 'star', 'tiny', 'maker']
+
+
+def make_taxonomy(size: int, rng: random.Random) -> list:
+    """실제 키워드 + 합성 키워드로 size개짜리 분류 체계 생성"""
+    taxonomy = list(PastSelfAnalyzer.taxonomy())
+    seen = set(taxonomy)
+    while len(taxonomy) < size:
+        kw = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if kw not in seen:
+            seen.add(kw)
+            taxonomy.append(kw)
+    return taxonomy[:size]
+
+
+def make_stems(count: int, rng: random.Random) -> list:
+    """기계 생성 작품명 흉내"""
+    return ['_'.join(rng.choice(WORDS) for _ in range(rng.randint(2, 4))) + f'_{i}'
+            for i in range(count)]
+
+
+def loop_match(taxonomy, stems) -> list:
+    """기존 방식: 키워드마다 부분 문자열 검사"""
+    return [{kw for kw in taxonomy if kw in stem} for stem in stems]
+
+
+def automaton_match(taxonomy, stems) -> list:
+    """오토마톤 방식: 파일명당 한 번의 스캔"""
+    automaton = KeywordAutomaton(taxonomy)
+    return [automaton.find_all(stem) for stem in stems]
+
+
+def analyzer_match(taxonomy, stems) -> list:
+    """분석기 경로: 분류 체계를 가진 PastSelfAnalyzer의 scan_file"""
+    analyzer_class = type('SyntheticAnalyzer', (PastSelfAnalyzer,), {
+        'EMOTION_KEYWORDS': tuple(taxonomy), 'TIME_KEYWORDS': (), 'BINARY_KEYWORDS': (),
+        'RELATIONSHIP_KEYWORDS': (), 'ART_KEYWORDS': ()
+    })
+    analyzer = analyzer_class('.')
+    return [set(analyzer.scan_file(Path(stem + '.py'))['keywords']) for stem in stems]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--stems', type=int, default=20000)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[43, 500, 2000, 5000])
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    stems = make_stems(args.stems, rng)
+
+    print(f"🔍 Keyword matching over {len(stems)} stems")
+    print(f"  {'keywords':>8s}  {'loop (s)':>9s}  {'automaton (s)':>13s}  {'scan_file (s)':>13s}  {'speedup':>7s}")
+
+    for size in args.sizes:
+        taxonomy = make_taxonomy(size, rng)
+        expected, loop_time = timed(loop_match, taxonomy, stems)
+        actual, auto_time = timed(automaton_match, taxonomy, stems)
+        scanned, scan_time = timed(analyzer_match, taxonomy, stems)
+        assert expected == actual, "automaton disagrees with substring loop"
+        assert expected == scanned, "scan_file disagrees with substring loop"
+        print(f"  {size:8d}  {loop_time:9.3f}  {auto_time:13.3f}  {scan_time:13.3f}  {loop_time / scan_time:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Choice Log - 선택을 한 줄씩 덧붙이는 기록
+JSONL append-only 로그: 선택마다 한 줄, fsync는 묶어서, 중단된 꼬리는 다음에 열 때 잘라낸다
+
+    {"format": "binary-hearts-choices", "version": 1}        ← 첫 줄 (헤더)
+    {"category": "expression", "choice": 1, "total_options": 4, "timestamp": "..."}
+    ...
+"""
+
+import json
+import os
+import time
+
+LOG_FORMAT = 'binary-hearts-choices'
+LOG_VERSION = 1
+TAIL_BLOCK = 1 << 16
+
+
+def _valid(line: bytes) -> bool:
+    try:
+        return isinstance(json.loads(line), dict)
+    except ValueError:
+        return False
+
+
+def recover(path: str) -> int:
+    """끝에 남은 불완전한 줄(쓰다 만 줄, 깨진 줄)을 잘라냄 - 잘라낸 바이트 수
+
+    중단은 꼬리에서만 일어나므로 마지막 블록만 본다.
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return 0
+
+    with open(path, 'r+b') as f:
+        start = max(0, size - TAIL_BLOCK)
+        f.seek(start)
+        tail = f.read()
+
+        end = len(tail)
+        while end:
+            newline = tail.rfind(b'\n', 0, end)
+            if newline == end - 1:
+                # 완전한 줄 - 내용이 멀쩡하면 여기까지가 유효
+                line_start = tail.rfind(b'\n', 0, newline) + 1
+                if line_start == 0 and start:
+                    break  # 블록보다 긴 줄 - 그대로 둠
+                if _valid(tail[line_start:newline]):
+                    break
+                end = line_start
+            elif newline < 0 and start:
+                break  # 블록 전체가 한 줄의 일부 - 판단할 수 없으므로 그대로 둠
+            else:
+                end = newline + 1
+
+        valid = start + end
+        if valid < size:
+            f.truncate(valid)
+        return size - valid
+
+
+def replay(path: str):
+    """로그의 선택 기록을 순서대로 (헤더와 깨진 꼬리는 건너뜀)"""
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                return
+            try:
+                record = json.loads(line)
+            except ValueError:
+                return
+            if 'format' in record:
+                if record['format'] != LOG_FORMAT or record.get('version') != LOG_VERSION:
+                    raise ValueError(f"{path}: not a {LOG_FORMAT} v{LOG_VERSION} log")
+                continue
+            yield record
+
+
+class ChoiceLog:
+    """append-only 선택 로그
+
+    append는 버퍼에 쓰기만 하고, sync_every개마다 또는 sync_interval초가 지나면
+    flush + fsync. 갑자기 꺼지면 마지막 동기화 이후의 기록(최대 sync_every개)만 잃는다.
+    """
+
+    SYNC_EVERY = 64
+    SYNC_INTERVAL = 1.0
+
+    def __init__(self, path: str, sync_every: int = SYNC_EVERY, sync_interval: float = SYNC_INTERVAL):
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.recovered_bytes = recover(path)
+
+        self._file = open(path, 'ab')
+        if self._file.tell() == 0:
+            header = {'format': LOG_FORMAT, 'version': LOG_VERSION}
+            self._file.write(json.dumps(header).encode('utf-8') + b'\n')
+            self.sync()
+
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, record: dict):
+        """기록 한 줄 덧붙이기"""
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n')
+        self._pending += 1
+        if self._pending >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self):
+        """디스크까지 내려쓰기"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Compact Format - 압축된 열 지향 분석 결과
+파일명 한 번만 저장 (intern table) + 카테고리마다 정수 ID 배열
+
+Layout (little-endian):
+    header   magic 'BHPA', u16 version, u16 reserved, u64 index offset, u64 index length
+    stems    UTF-8 파일명 이어 붙인 blob + u32 offsets[count + 1]
+    arrays   카테고리마다 u32 stem ID 배열 (원래 목록 순서)
+    index    UTF-8 JSON - 통계, 섹션 위치, 카테고리별 (offset, count)
+
+읽을 때는 mmap 위에서 header와 index만 파싱하고, 필요한 카테고리 배열과 그 파일명만 읽는다.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from pattern_index import archive_order
+
+MAGIC = b'BHPA'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQQ')
+
+# 보고서에서 파일 목록인 항목 / 키워드별 파일 목록 묶음
+LIST_FIELDS = ('emotion_files', 'binary_files', 'relationship_files')
+GROUP_FIELDS = ('time_themes', 'artistic_themes')
+
+
+def _u32(values) -> bytes:
+    data = array('I', values)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data.tobytes()
+
+
+def _from_u32(raw: bytes) -> array:
+    data = array('I')
+    data.frombytes(raw)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    return data
+
+
+def iter_categories(analysis: dict):
+    """(카테고리 이름, 파일 목록) - 묶음은 'time_themes.dawn' 형태"""
+    for field in LIST_FIELDS:
+        if field in analysis:
+            yield field, analysis[field]
+    for group in GROUP_FIELDS:
+        for keyword, files in analysis.get(group, {}).items():
+            yield f"{group}.{keyword}", files
+
+
+def write_compact(analysis: dict, output_path: str):
+    """analyze_all() 결과를 압축 형식으로 저장"""
+    categories = list(iter_categories(analysis))
+    stems = sorted({stem for _, files in categories for stem in files}, key=archive_order)
+    stem_ids = {stem: i for i, stem in enumerate(stems)}
+
+    with open(output_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+
+        blob = b''.join(stem.encode('utf-8') for stem in stems)
+        offsets = [0]
+        for stem in stems:
+            offsets.append(offsets[-1] + len(stem.encode('utf-8')))
+        stems_offset = f.tell()
+        f.write(blob)
+        offsets_offset = f.tell()
+        f.write(_u32(offsets))
+
+        sections = {}
+        for name, files in categories:
+            sections[name] = {'offset': f.tell(), 'count': len(files)}
+            f.write(_u32(stem_ids[stem] for stem in files))
+
+        index = {key: value for key, value in analysis.items()
+                 if key not in LIST_FIELDS and key not in GROUP_FIELDS}
+        index.update({
+            'fields': list(analysis),
+            'stems': {'offset': stems_offset, 'count': len(stems), 'offsets_offset': offsets_offset},
+            'groups': {group: list(analysis[group]) for group in GROUP_FIELDS if group in analysis},
+            'categories': sections
+        })
+        raw_index = json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        index_offset = f.tell()
+        f.write(raw_index)
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, index_offset, len(raw_index)))
+
+
+def is_compact(path: str) -> bool:
+    """압축 형식 파일인지 (매직 바이트 확인)"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class StemList:
+    """카테고리 파일 목록의 지연 시퀀스 - 길이는 바로, 파일명은 접근할 때 디코딩"""
+
+    def __init__(self, analysis: 'CompactAnalysis', ids):
+        self._analysis = analysis
+        self._ids = ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._analysis.stem(stem_id) for stem_id in self._ids[i]]
+        return self._analysis.stem(self._ids[i])
+
+    def __iter__(self):
+        stem = self._analysis.stem
+        for stem_id in self._ids:
+            yield stem(stem_id)
+
+    def __contains__(self, name):
+        return any(stem == name for stem in self)
+
+
+class CompactAnalysis:
+    """압축 형식의 읽기 전용 mmap 핸들 - 필요한 부분만 페이지 인"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, index_offset, index_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path}: not a compact analysis (version {VERSION})")
+
+        self.index = json.loads(self._map[index_offset:index_offset + index_length].decode('utf-8'))
+        stems = self.index['stems']
+        self._stems_offset = stems['offset']
+        self._offsets = self._u32_view(stems['offsets_offset'], stems['count'] + 1)
+
+    def _u32_view(self, offset: int, count: int):
+        """u32 배열 - 가능하면 복사 없이 mmap 위의 view"""
+        if sys.byteorder == 'little':
+            return memoryview(self._map)[offset:offset + 4 * count].cast('I')
+        return _from_u32(self._map[offset:offset + 4 * count])
+
+    @property
+    def total_files(self) -> int:
+        return self.index['total_files']
+
+    def categories(self) -> list:
+        """카테고리 이름 목록"""
+        return list(self.index['categories'])
+
+    def count(self, category: str) -> int:
+        """카테고리의 파일 수 (배열을 읽지 않음)"""
+        section = self.index['categories'].get(category)
+        return section['count'] if section else 0
+
+    def keyword_count(self, keyword: str) -> int:
+        """파일명 상위 키워드 빈도 (상위 목록에 없으면 0)"""
+        return self.index.get('filename_keywords', {}).get(keyword, 0)
+
+    def stem(self, stem_id: int) -> str:
+        """ID → 파일명"""
+        start = self._stems_offset + self._offsets[stem_id]
+        end = self._stems_offset + self._offsets[stem_id + 1]
+        return self._map[start:end].decode('utf-8')
+
+    def files(self, category: str) -> StemList:
+        """카테고리에 속한 파일명 (저장 당시 순서, 지연 디코딩)"""
+        section = self.index['categories'][category]
+        return StemList(self, self._u32_view(section['offset'], section['count']))
+
+    def to_dict(self) -> dict:
+        """analyze_all()과 같은 모양의 dict로 전부 복원"""
+        groups = self.index['groups']
+        analysis = {}
+        for field in self.index['fields']:
+            if field in LIST_FIELDS:
+                analysis[field] = list(self.files(field))
+            elif field in groups:
+                analysis[field] = {kw: list(self.files(f"{field}.{kw}")) for kw in groups[field]}
+            else:
+                analysis[field] = self.index[field]
+        return analysis
+
+    def close(self):
+        # 바깥에 남은 view가 있으면 mmap을 닫을 수 없다 - 가비지 컬렉션에 맡김
+        self._offsets = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
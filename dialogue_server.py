@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Dialogue Server - 관람자마다 하나씩, 동시에 흐르는 대화
+asyncio 서버: TCP 또는 Unix 소켓으로 접속한 관람자에게 각자의 박자로 대화를 재생한다
+
+    python3 dialogue_server.py --tcp 127.0.0.1:7777 --unix /tmp/binary_hearts.sock
+    nc 127.0.0.1 7777                       # 기본 박자로 관람
+    (echo 10x; cat) | nc 127.0.0.1 7777     # 첫 줄로 박자 지정 (real, instant, 10x ...)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from analysis_reader import DEFAULT_ANALYSIS, load_past_stats
+from binary_hearts_dialogue import Dialogue, session_script
+from pacing import PacingClock
+
+HELLO_TIMEOUT = 0.25      # 박자 줄을 기다리는 시간 (보내지 않으면 기본 박자)
+WRITE_LIMIT = 64 * 1024   # 관람자별 송신 버퍼 상한
+DRAIN_TIMEOUT = 10.0      # 버퍼가 이 시간 안에 비지 않으면 느린 관람자로 보고 끊음
+BACKLOG = 1024            # 한꺼번에 접속하는 관람자를 받아 둘 대기열
+
+
+class DialogueServer:
+    """관람자별 코루틴으로 대화를 재생하는 서버"""
+
+    def __init__(self, analysis_path: str = DEFAULT_ANALYSIS, pace: str = 'real',
+                 drain_timeout: float = DRAIN_TIMEOUT, max_sessions: int = None):
+        # 통계는 한 번만 읽어서 모든 관람자가 공유
+        self.stats = load_past_stats(analysis_path)
+        self.pace = pace
+        self.drain_timeout = drain_timeout
+        self.max_sessions = max_sessions
+        self.counts = {'active': 0, 'completed': 0, 'dropped': 0, 'disconnected': 0}
+        self.finished = asyncio.Event()
+        self._dialogue = Dialogue()
+
+    async def _read_pace(self, reader) -> PacingClock:
+        """관람자가 첫 줄로 보낸 박자 (없거나 잘못되면 서버 기본값)"""
+        try:
+            line = await asyncio.wait_for(reader.readline(), HELLO_TIMEOUT)
+            return PacingClock.parse(line.decode('utf-8', 'replace').strip() or self.pace)
+        except (asyncio.TimeoutError, ValueError):
+            return PacingClock.parse(self.pace)
+
+    async def handle(self, reader, writer):
+        """관람자 한 명 - 대본을 재생하고 지연은 asyncio.sleep으로"""
+        writer.transport.set_write_buffer_limits(high=WRITE_LIMIT)
+        self.counts['active'] += 1
+        outcome = 'completed'
+        try:
+            clock = await self._read_pace(reader)
+            for text, delay in session_script(self._dialogue, self.stats):
+                if text:
+                    writer.write(text.encode('utf-8'))
+                    # 버퍼가 상한을 넘었을 때만 기다림 - 이 관람자만 멈추고 나머지는 계속
+                    await asyncio.wait_for(writer.drain(), self.drain_timeout)
+                if delay:
+                    await clock.apause(delay)
+        except asyncio.TimeoutError:
+            outcome = 'dropped'
+            writer.transport.abort()
+        except (ConnectionError, OSError):
+            outcome = 'disconnected'
+        finally:
+            self.counts['active'] -= 1
+            self.counts[outcome] += 1
+            writer.close()
+            self._check_finished()
+
+    def _check_finished(self):
+        done = self.counts['completed'] + self.counts['dropped'] + self.counts['disconnected']
+        if self.max_sessions is not None and done >= self.max_sessions:
+            self.finished.set()
+
+    async def serve(self, tcp: str = None, unix: str = None):
+        """리스너를 열고 finished까지 (max_sessions가 없으면 끝없이) 서비스"""
+        servers = []
+        if tcp:
+            host, _, port = tcp.rpartition(':')
+            servers.append(await asyncio.start_server(
+                self.handle, host or '127.0.0.1', int(port), backlog=BACKLOG))
+        if unix:
+            if os.path.exists(unix):
+                os.unlink(unix)
+            servers.append(await asyncio.start_unix_server(self.handle, unix, backlog=BACKLOG))
+        if not servers:
+            raise ValueError("need at least one of tcp or unix")
+
+        for server in servers:
+            for sock in server.sockets:
+                print(f"💕 Listening on {sock.getsockname()}", file=sys.stderr)
+
+        try:
+            await self.finished.wait()
+        finally:
+            for server in servers:
+                server.close()
+                await server.wait_closed()
+            if unix and os.path.exists(unix):
+                os.unlink(unix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tcp', help="HOST:PORT 로 대기 (예: 127.0.0.1:7777)")
+    parser.add_argument('--unix', help="Unix 소켓 경로")
+    parser.add_argument('--analysis', default=DEFAULT_ANALYSIS, help="통계를 읽을 분석 파일 (JSON 또는 압축 형식)")
+    parser.add_argument('--pace', default=os.environ.get('BINARY_HEARTS_PACE', 'real'),
+                        help="관람자가 박자를 보내지 않을 때의 기본 박자 (real, instant, 10x ...)")
+    parser.add_argument('--drain-timeout', type=float, default=DRAIN_TIMEOUT,
+                        help="느린 관람자를 끊기 전까지 기다리는 초")
+    parser.add_argument('--max-sessions', type=int, help="이만큼 관람이 끝나면 종료 (부하 테스트용)")
+    args = parser.parse_args()
+
+    if not args.tcp and not args.unix:
+        parser.error("give --tcp and/or --unix")
+
+    async def run():
+        server = DialogueServer(args.analysis, args.pace, args.drain_timeout, args.max_sessions)
+        try:
+            await server.serve(args.tcp, args.unix)
+        finally:
+            print(f"✨ Sessions: {server.counts}", file=sys.stderr)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Emotion Resolver - 작품 제목 → 감정
+'_'로 나눈 토큰 위의 트라이: 여러 토큰 키워드(emotion_echo)와 접두 키워드(dawn*)를 함께 찾는다
+"""
+
+from functools import lru_cache
+
+
+class _Node:
+    __slots__ = ('children', 'prefixes', 'value')
+
+    def __init__(self):
+        self.children = {}
+        # (접두어, 자식) - 긴 접두어 먼저
+        self.prefixes = []
+        self.value = None
+
+
+class TokenTrie:
+    """토큰 단위 트라이
+
+    키워드는 '_'로 이은 토큰열이고, 토큰 끝의 '*'는 그 접두어로 시작하는 토큰 전부.
+    같은 위치에서는 정확한 토큰이 접두 토큰보다, 긴 접두어가 짧은 접두어보다 우선한다.
+    """
+
+    def __init__(self, rules: dict = None):
+        self.root = _Node()
+        self.size = 0
+        for keyword, value in (rules or {}).items():
+            self.insert(keyword, value)
+
+    def insert(self, keyword: str, value):
+        """키워드 추가 (같은 키워드는 값을 덮어씀)"""
+        node = self.root
+        for token in keyword.lower().split('_'):
+            if token.endswith('*'):
+                prefix = token[:-1]
+                child = next((c for p, c in node.prefixes if p == prefix), None)
+                if child is None:
+                    child = _Node()
+                    node.prefixes.append((prefix, child))
+                    node.prefixes.sort(key=lambda item: -len(item[0]))
+            else:
+                child = node.children.get(token)
+                if child is None:
+                    child = node.children[token] = _Node()
+            node = child
+
+        if node.value is None:
+            self.size += 1
+        node.value = value
+
+    @staticmethod
+    def _step(node: _Node, token: str) -> list:
+        """token으로 갈 수 있는 자식 전부 - 정확한 토큰, 긴 접두어, 짧은 접두어 순"""
+        children = []
+        child = node.children.get(token)
+        if child is not None:
+            children.append(child)
+        for prefix, child in node.prefixes:
+            if token.startswith(prefix):
+                children.append(child)
+        return children
+
+    def match_at(self, tokens, start: int):
+        """start에서 시작하는 가장 긴 키워드의 (값, 토큰 수) - 없으면 None
+
+        갈 수 있는 경로를 모두 따라가므로, 앞 토큰에서 덜 우선인 자식을 거쳐야
+        닿는 더 긴 키워드도 찾는다. 길이가 같으면 우선순위가 높은 경로의 값.
+        """
+        frontier = [self.root]
+        best = None
+        for end in range(start, len(tokens)):
+            token = tokens[end]
+            frontier = [child for node in frontier for child in self._step(node, token)]
+            if not frontier:
+                break
+            for node in frontier:
+                if node.value is not None:
+                    best = (node.value, end - start + 1)
+                    break
+        return best
+
+    def first_match(self, tokens):
+        """왼쪽부터 처음 걸리는 키워드의 값"""
+        for start in range(len(tokens)):
+            found = self.match_at(tokens, start)
+            if found:
+                return found[0]
+        return None
+
+    def __len__(self):
+        return self.size
+
+
+class EmotionResolver:
+    """작품 이름 → 감정 (이름마다 결과를 기억)"""
+
+    MEMO_SIZE = 1 << 16
+
+    def __init__(self, rules: dict, default):
+        self.trie = TokenTrie(rules)
+        self.default = default
+        self.resolve = lru_cache(maxsize=self.MEMO_SIZE)(self._resolve)
+
+    def _resolve(self, work_name: str):
+        found = self.trie.first_match(work_name.lower().split('_'))
+        return self.default if found is None else found
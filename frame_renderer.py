@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Frame Renderer - 한 화면을 한 번에
+print()를 줄마다 부르는 대신 프레임 전체를 버퍼에 모아 write 한 번으로 내보낸다.
+diff 모드에서는 animate_flower처럼 화면을 다시 그릴 때 바뀐 줄만 커서를 옮겨 덮어쓴다.
+"""
+
+import shutil
+import sys
+
+
+class Frame:
+    """print()와 같은 사용법으로 한 프레임을 모으는 버퍼"""
+
+    __slots__ = ('_parts',)
+
+    def __init__(self):
+        self._parts = []
+
+    def print(self, *values, sep: str = ' ', end: str = '\n'):
+        self._parts.append(sep.join(map(str, values)) + end)
+
+    def write(self, text: str):
+        self._parts.append(text)
+
+    def getvalue(self) -> str:
+        return ''.join(self._parts)
+
+    __str__ = getvalue
+
+
+class FrameRenderer:
+    """프레임 단위 출력기 - 프레임마다 write 시스템 콜 한 번
+
+    diff=False: 프레임을 그대로 이어서 출력 (clear=True면 매번 화면을 지우고 맨 위부터)
+    diff=True:  첫 프레임은 화면을 지우고 전체, 이후에는 이전 프레임과 다른 줄만
+                ESC[행;1H로 찾아가 덮어쓰고, 줄어든 부분은 ESC[J로 지운다.
+                화면보다 긴 프레임은 스크롤되어 행 번호가 어긋나므로 매번 지우고 전체를 다시 그린다
+    rows: 화면 높이 (기본: 렌더링할 때의 터미널 높이)
+    """
+
+    CLEAR = '\x1b[H\x1b[2J'
+
+    def __init__(self, stream=None, diff: bool = False, clear: bool = False, rows: int = None):
+        self.stream = stream or sys.stdout
+        self.diff = diff
+        self.clear = clear
+        self.rows = rows
+        self.encoding = getattr(self.stream, 'encoding', None) or 'utf-8'
+        self._previous = None
+        self.frames = 0
+        self.bytes_written = 0
+
+    def _emit(self, text: str) -> int:
+        """이미 print된 내용 뒤에 순서대로, 한 번의 write + flush"""
+        data = text.encode(self.encoding, 'replace')
+        buffer = getattr(self.stream, 'buffer', None)
+        if buffer is None:
+            self.stream.write(text)
+            self.stream.flush()
+        else:
+            self.stream.flush()
+            buffer.write(data)
+            buffer.flush()
+        self.bytes_written += len(data)
+        return len(data)
+
+    def write(self, text: str) -> int:
+        """텍스트 조각을 그대로 한 번에 (diff 상태와 무관)"""
+        return self._emit(text) if text else 0
+
+    def _changes(self, lines: list) -> str:
+        previous = self._previous
+        parts = []
+        if len(lines) < len(previous):
+            # 줄어든 아랫부분 먼저 지움
+            parts.append(f'\x1b[{len(lines) + 1};1H\x1b[J')
+        for row, line in enumerate(lines):
+            # 마지막 줄은 항상 다시 써서 커서가 전체 출력과 같은 자리에 오게 함
+            if row >= len(previous) or previous[row] != line or row == len(lines) - 1:
+                parts.append(f'\x1b[{row + 1};1H{line}\x1b[K')
+        return ''.join(parts)
+
+    def render(self, frame) -> int:
+        """프레임 출력 (Frame 또는 문자열) - 쓴 바이트 수"""
+        text = frame.getvalue() if isinstance(frame, Frame) else frame
+        self.frames += 1
+
+        if not self.diff:
+            return self._emit(self.CLEAR + text if self.clear else text)
+
+        lines = text.split('\n')
+        rows = self.rows or shutil.get_terminal_size().lines
+        if len(lines) >= rows:
+            # 화면에 다 들어가지 않음 - 절대 행 이동은 맨 아래 줄로 몰리므로 전체를 다시
+            self._previous = None
+            return self._emit(self.CLEAR + text)
+
+        if self._previous is None:
+            out = self.CLEAR + text
+        else:
+            out = self._changes(lines)
+        self._previous = lines
+        return self._emit(out)
+
+    def reset(self):
+        """다음 프레임은 화면 전체를 다시 그림 (다른 출력이 끼어든 뒤)"""
+        self._previous = None
+
+
+def render(frame, stream=None) -> int:
+    """프레임 하나를 한 번에 출력"""
+    return FrameRenderer(stream).render(frame)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Heavy Hitters - 정해진 메모리로 자주 나오는 키워드 찾기
+Space-Saving (Metwally et al.): 어휘가 끝없이 늘어나도 카운터는 capacity개뿐
+"""
+
+import heapq
+
+
+class SpaceSaving:
+    """Space-Saving 상위 빈도 추정기
+
+    항목마다 (추정 빈도, 오차)를 유지한다.
+      추정 빈도 - 오차 ≤ 실제 빈도 ≤ 추정 빈도
+      오차 ≤ error_bound = 전체 개수 / capacity
+    실제 빈도가 error_bound보다 큰 항목은 반드시 남아 있다.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self.counts = {}
+        self.errors = {}
+        # (빈도, 항목) 최소 힙 - 갱신 시 새로 넣고 오래된 항목은 꺼낼 때 버림
+        self._heap = []
+
+    def add(self, item, count: int = 1):
+        """항목 count번 관측"""
+        self.total += count
+        counts = self.counts
+
+        if item in counts:
+            counts[item] += count
+        elif len(counts) < self.capacity:
+            counts[item] = count
+            self.errors[item] = 0
+        else:
+            # 가장 작은 카운터를 넘겨받음 - 그 빈도만큼이 최대 과대 추정
+            floor, victim = self._pop_min()
+            del counts[victim]
+            del self.errors[victim]
+            counts[item] = floor + count
+            self.errors[item] = floor
+
+        heapq.heappush(self._heap, (counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._compact()
+
+    def update(self, items):
+        """Counter.update와 같은 사용법"""
+        for item in items:
+            self.add(item)
+
+    def _pop_min(self):
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return count, item
+
+    def _compact(self):
+        """오래된 힙 항목 정리"""
+        self._heap = [(count, item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    @property
+    def error_bound(self) -> float:
+        """어떤 항목이든 추정 빈도가 실제보다 클 수 있는 최대치"""
+        return self.total / self.capacity
+
+    def guaranteed(self, item) -> int:
+        """실제 빈도의 하한"""
+        return self.counts.get(item, 0) - self.errors.get(item, 0)
+
+    def most_common(self, n: int = None) -> list:
+        """(항목, 추정 빈도) 목록 - 빈도 내림차순, 동률은 항목순"""
+        ranked = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return ranked if n is None else ranked[:n]
+
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        """두 요약 합치기 (Agarwal et al. mergeable summaries)
+
+        한쪽에만 있는 항목은 다른 쪽의 최소 카운터만큼 있었을 수도 있으므로
+        그만큼을 빈도와 오차에 더한 뒤 상위 capacity개만 남긴다.
+        """
+        if self.capacity != other.capacity:
+            raise ValueError("cannot merge summaries with different capacities")
+
+        def floor(summary):
+            full = len(summary.counts) >= summary.capacity
+            return min(summary.counts.values()) if full else 0
+
+        self_floor, other_floor = floor(self), floor(other)
+        counts, errors = {}, {}
+        for item in self.counts.keys() | other.counts.keys():
+            count = error = 0
+            for summary, missing in ((self, self_floor), (other, other_floor)):
+                if item in summary.counts:
+                    count += summary.counts[item]
+                    error += summary.errors[item]
+                else:
+                    count += missing
+                    error += missing
+            counts[item] = count
+            errors[item] = error
+
+        merged = SpaceSaving(self.capacity)
+        merged.total = self.total + other.total
+        kept = sorted(counts, key=lambda item: (-counts[item], item))[:self.capacity]
+        merged.counts = {item: counts[item] for item in kept}
+        merged.errors = {item: errors[item] for item in kept}
+        merged._compact()
+        return merged
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화용"""
+        return {
+            'capacity': self.capacity,
+            'total': self.total,
+            'counts': self.counts,
+            'errors': self.errors
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SpaceSaving':
+        """to_dict() 결과에서 복원"""
+        summary = cls(data['capacity'])
+        summary.total = data['total']
+        summary.counts = dict(data['counts'])
+        summary.errors = dict(data['errors'])
+        summary._compact()
+        return summary
+
+    def __getitem__(self, item) -> int:
+        return self.counts.get(item, 0)
+
+    def __iter__(self):
+        return iter(self.counts)
+
+    def __len__(self):
+        return len(self.counts)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Journey Aggregator - 여러 세션의 선택 여정 모아 보기
+reflection_journey.json 같은 파일 수천 개를 프로세스 풀로 흘려 읽고 하나의 요약으로 줄인다
+
+    카테고리별 선택지 분포 (세션 전체)
+    카테고리별 과거의 선택(past_preference)과 일치한 비율
+    세션 일관성 히스토그램
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+from archive_walker import walk_archive
+from pattern_analyzer import bounded_map
+from self_reflection import PAST_PREFERENCES, SelfReflection
+
+SUMMARY_FORMAT = 'binary-hearts-journeys'
+HISTOGRAM_BINS = 10   # 일관성 0.0-0.1, ..., 0.9-1.0
+BATCH_SIZE = 64       # 작업 하나가 읽는 여정 파일 수
+MAX_ERRORS = 20       # 요약에 남기는 읽기 실패 예시 수
+
+
+def empty_summary() -> dict:
+    """합치기의 항등원"""
+    return {
+        'sessions': 0,
+        'choices': 0,
+        'skipped': 0,
+        'errors': [],
+        'options': {},                       # 카테고리 → 선택지 (1부터, 문자열) → 횟수
+        'agreement': {},                     # 카테고리 → [일치, 전체]
+        'consistency_histogram': [0] * HISTOGRAM_BINS
+    }
+
+
+def add_session(summary: dict, engine: SelfReflection):
+    """세션 하나를 요약에 더함 - 엔진의 누적 통계만 읽음"""
+    summary['sessions'] += 1
+    summary['choices'] += len(engine.choices)
+
+    for category, counts in engine.option_counts.items():
+        options = summary['options'].setdefault(category, {})
+        for option, count in counts.items():
+            options[str(option)] = options.get(str(option), 0) + count
+
+        if category in PAST_PREFERENCES:
+            agreement = summary['agreement'].setdefault(category, [0, 0])
+            # 기록은 1부터, past_preference는 0부터
+            agreement[0] += counts.get(PAST_PREFERENCES[category] + 1, 0)
+            agreement[1] += engine.patterns[category]
+
+    if len(engine.choices) >= 2:
+        consistency = engine.analyze_patterns()['consistency']
+        summary['consistency_histogram'][min(int(consistency * HISTOGRAM_BINS), HISTOGRAM_BINS - 1)] += 1
+
+
+def merge_summaries(summary: dict, other: dict) -> dict:
+    """두 요약 합치기 (summary를 고쳐서 돌려줌)"""
+    for key in ('sessions', 'choices', 'skipped'):
+        summary[key] += other[key]
+    summary['errors'].extend(other['errors'][:MAX_ERRORS - len(summary['errors'])])
+
+    for category, counts in other['options'].items():
+        options = summary['options'].setdefault(category, {})
+        for option, count in counts.items():
+            options[option] = options.get(option, 0) + count
+    for category, (matched, total) in other['agreement'].items():
+        agreement = summary['agreement'].setdefault(category, [0, 0])
+        agreement[0] += matched
+        agreement[1] += total
+    summary['consistency_histogram'] = [
+        a + b for a, b in zip(summary['consistency_histogram'], other['consistency_histogram'])
+    ]
+    return summary
+
+
+def walked_log(path: str, log: str, root: str) -> bool:
+    """여정 요약이 가리키는 로그를 걷기가 따로 만나는지 (root 아래의 *.jsonl)"""
+    log_path = os.path.abspath(os.path.join(os.path.dirname(path), log))
+    root = os.path.abspath(root)
+    try:
+        inside = os.path.commonpath([log_path, root]) == root
+    except ValueError:
+        return False  # 다른 드라이브 (Windows)
+    return inside and log_path.endswith('.jsonl') and os.path.isfile(log_path)
+
+
+def summarize_batch(paths: list, root: str = None) -> dict:
+    """작업자 프로세스 - 여정 파일 묶음 하나의 부분 요약
+
+    --log로 저장한 세션은 요약(.json)과 로그(.jsonl)가 둘 다 걸리므로,
+    로그가 root 안에 있으면 로그 쪽만 센다.
+    """
+    summary = empty_summary()
+    for path in paths:
+        try:
+            data = None
+            if path.endswith('.json'):
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if root is not None and 'log' in data and walked_log(path, data['log'], root):
+                    continue
+            engine = SelfReflection.from_journey(path, data)
+            # 세션 몫을 따로 만든 뒤 합침 - 중간에 실패해도 요약이 반쯤 바뀌지 않게
+            session = empty_summary()
+            add_session(session, engine)
+        except (OSError, ValueError, KeyError, TypeError, ArithmeticError) as e:
+            # 깨진 파일 하나가 풀 전체를 멈추지 않도록 건너뛰고 기록
+            summary['skipped'] += 1
+            if len(summary['errors']) < MAX_ERRORS:
+                summary['errors'].append(f"{path}: {type(e).__name__}: {e}")
+            continue
+        merge_summaries(summary, session)
+    return summary
+
+
+def iter_batches(root: str, size: int = BATCH_SIZE):
+    """여정 파일 경로를 size개씩 - 목록을 만들지 않고 발견하는 대로"""
+    paths = (str(path) for _, path in walk_archive(root, include=('*.json', '*.jsonl'), recursive=True))
+    while True:
+        batch = list(islice(paths, size))
+        if not batch:
+            return
+        yield batch
+
+
+def aggregate(root: str, workers: int = None) -> dict:
+    """디렉터리의 모든 여정을 병렬로 요약"""
+    workers = workers or os.cpu_count() or 1
+    summary = empty_summary()
+    if workers == 1:
+        for batch in iter_batches(root):
+            merge_summaries(summary, summarize_batch(batch, root))
+        return summary
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summarize = partial(summarize_batch, root=root)
+        for _, batch_summary in bounded_map(executor, summarize, iter_batches(root), 4 * workers):
+            merge_summaries(summary, batch_summary)
+    return summary
+
+
+def finalize(summary: dict) -> dict:
+    """비율 계산을 덧붙인 저장용 요약"""
+    distributions = {}
+    for category, counts in sorted(summary['options'].items()):
+        total = sum(counts.values())
+        distributions[category] = {
+            option: round(count / total, 6)
+            for option, count in sorted(counts.items(), key=lambda item: int(item[0]))
+        }
+
+    # 시나리오 순서로
+    agreement_rates = {}
+    for category in PAST_PREFERENCES:
+        if category in summary['agreement']:
+            matched, total = summary['agreement'][category]
+            agreement_rates[category] = round(matched / total, 6) if total else 0.0
+    matched = sum(m for m, _ in summary['agreement'].values())
+    total = sum(t for _, t in summary['agreement'].values())
+
+    return {
+        'format': SUMMARY_FORMAT,
+        **summary,
+        'distributions': distributions,
+        'agreement_rates': agreement_rates,
+        'overall_agreement': round(matched / total, 6) if total else 0.0,
+        'histogram_bins': [round(i / HISTOGRAM_BINS, 2) for i in range(HISTOGRAM_BINS + 1)]
+    }
+
+
+def print_summary(result: dict):
+    """요약 출력"""
+    print("=" * 60)
+    print("🗺️  JOURNEYS ACROSS SESSIONS")
+    print("=" * 60)
+    print(f"\n📊 Sessions: {result['sessions']:,}  Choices: {result['choices']:,}  "
+          f"Skipped: {result['skipped']:,}")
+
+    print("\n🎯 Agreement with past self:")
+    for category, rate in result['agreement_rates'].items():
+        print(f"   {category:15s} : {'█' * round(rate * 20):20s} {rate:.1%}")
+    print(f"   {'overall':15s} : {result['overall_agreement']:.1%}")
+
+    print("\n📈 Consistency histogram:")
+    top = max(result['consistency_histogram']) or 1
+    for i, count in enumerate(result['consistency_histogram']):
+        low, high = result['histogram_bins'][i], result['histogram_bins'][i + 1]
+        print(f"   {low:.1f}-{high:.1f} : {'█' * round(count / top * 30):30s} {count:,}")
+    print("\n" + "=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('journeys', help="여정 파일 디렉터리 (하위 폴더 포함, *.json / *.jsonl)")
+    parser.add_argument('--output', default='journey_summary.json', help="요약 JSON 경로")
+    parser.add_argument('--workers', type=int, help="작업자 프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = finalize(aggregate(args.journeys, args.workers))
+    elapsed = time.perf_counter() - start
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, separators=(',', ':'))
+
+    print_summary(result)
+    print(f"💾 Summary saved to: {args.output} ({result['sessions']:,} sessions in {elapsed:.2f}s)",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
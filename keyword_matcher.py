@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Keyword Matcher - 다중 키워드 동시 탐색기
+Aho-Corasick automaton: 키워드가 수천 개로 늘어나도 파일명을 한 번만 훑는다
+"""
+
+from collections import deque
+from functools import lru_cache
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 패턴 매처"""
+
+    def __init__(self, keywords):
+        # 빈 문자열은 모든 곳에 매칭되므로 제외
+        self.keywords = tuple(kw for kw in dict.fromkeys(keywords) if kw)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        for keyword in self.keywords:
+            self._insert(keyword)
+        self._link()
+
+    def _insert(self, keyword: str):
+        """트라이에 키워드 추가"""
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        self._out[state] = self._out[state] + (keyword,)
+
+    def _link(self):
+        """BFS로 실패 링크 연결 (출력은 실패 링크를 따라 합침)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[next_state] = goto[f].get(ch, 0)
+                out[next_state] = out[next_state] + out[fail[next_state]]
+
+    def iter_matches(self, text: str):
+        """(끝 위치, 키워드) 쌍을 등장 순서대로 생성"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for keyword in out[state]:
+                yield pos, keyword
+
+    def find_all(self, text: str) -> set:
+        """텍스트에 포함된 서로 다른 키워드 집합 (한 번의 스캔)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    def __len__(self):
+        return len(self.keywords)
+
+
+@lru_cache(maxsize=32)
+def compile_keywords(keywords: tuple) -> KeywordAutomaton:
+    """분류 체계당 한 번만 오토마톤 생성"""
+    return KeywordAutomaton(keywords)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Pacing - 연출용 지연을 한 곳에서
+실시간(데모), 배속, 지연 없음(CI·대량 생성)을 같은 코드로 오간다
+
+BINARY_HEARTS_PACE 환경 변수로 고른다:
+    real       실시간 (기본)
+    10x        열 배 빠르게 ('2x', '0.5x'도 가능)
+    instant    지연 없음 ('0', 'none'도 같음)
+"""
+
+import asyncio
+import os
+import time
+
+PACE_ENV = 'BINARY_HEARTS_PACE'
+
+
+class PacingClock:
+    """박자 시계 - 요청한 지연에 scale을 곱해서 잔다 (1 실시간, 0.1 열 배속, 0 지연 없음)"""
+
+    def __init__(self, scale: float = 1.0, sleep=time.sleep):
+        if scale < 0:
+            raise ValueError("pace scale must not be negative")
+        self.scale = scale
+        self._sleep = sleep
+        # 연출상 흘렀어야 할 시간 (실제로 잔 시간과 무관)
+        self.requested = 0.0
+
+    @classmethod
+    def parse(cls, spec: str, sleep=time.sleep) -> 'PacingClock':
+        """'real' / 'instant' / '10x' / 배율 숫자 → 시계"""
+        spec = spec.strip().lower()
+        if spec in ('', 'real', 'realtime'):
+            return cls(1.0, sleep)
+        if spec in ('instant', 'none', 'off'):
+            return cls(0.0, sleep)
+        try:
+            if spec.endswith('x'):
+                speed = float(spec[:-1])
+                return cls(1.0 / speed if speed > 0 else 0.0, sleep)
+            return cls(float(spec), sleep)
+        except ValueError:
+            raise ValueError(f"{PACE_ENV}: unknown pace {spec!r} (real, instant, 10x or a scale)") from None
+
+    @property
+    def instant(self) -> bool:
+        return self.scale == 0
+
+    def pause(self, seconds: float):
+        """연출용 지연"""
+        self.requested += seconds
+        delay = seconds * self.scale
+        if delay > 0:
+            self._sleep(delay)
+
+    async def apause(self, seconds: float):
+        """pause()의 asyncio 판 - 다른 코루틴을 막지 않는다"""
+        self.requested += seconds
+        delay = seconds * self.scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_clock = PacingClock.parse(os.environ.get(PACE_ENV, 'real'))
+
+
+def get_clock() -> PacingClock:
+    """현재 모듈 전체가 쓰는 시계"""
+    return _clock
+
+
+def set_clock(clock) -> PacingClock:
+    """시계 교체 (PacingClock 또는 'instant' 같은 문자열) - 이전 시계를 돌려준다"""
+    global _clock
+    previous = _clock
+    _clock = PacingClock.parse(clock) if isinstance(clock, str) else clock
+    return previous
+
+
+def pause(seconds: float):
+    """현재 시계로 연출용 지연"""
+    _clock.pause(seconds)
@@ -6,112 +6,300 @@ Claude Sonnet 4.5 discovering its own preferences through code archaeology
 
 import os
 import re
-from collections import Counter, defaultdict
+import zlib
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 import json
 
+from analysis_cache import FileFingerprintCache
+from archive_walker import walk_archive
+from compact_format import write_compact
+from frame_renderer import Frame, render
+from keyword_matcher import compile_keywords
+from pattern_index import PatternIndex, archive_order
+
+
+# 내용 분석 모드에서 찾는 한국어 감정 단어
+KOREAN_EMOTION_WORDS = (
+    '기쁨', '사랑', '평화', '그리움', '호기심', '경이', '연결', '성장',
+    '놀람', '꿈', '희망', '행복', '슬픔', '외로움', '설렘', '감사',
+    '따뜻', '고요', '평온', '우정'
+)
+
+# 이모지 하나 = 화면에 보이는 한 글자 (grapheme cluster)
+#   기본 그림 문자 + 이형 선택자(FE0F) + 피부색 + 태그, 이를 ZWJ(200D)로 이은 시퀀스,
+#   국기(지역 표시 문자 두 개), 키캡(0-9#* + 20E3)
+_EMOJI_BASE = (
+    "\U0001F000-\U0001FAFF"  # 그림 문자, 이모티콘, 운송, 기호 확장 등
+    "\u2600-\u27BF"          # 기타 기호 & 딩뱃
+    "\u2300-\u23FF"          # 기술 기호 (⌚ ⏰ ⏳)
+    "\u2B05-\u2B07\u2B1B\u2B1C\u2B50\u2B55"
+    "\u2194-\u2199\u21A9\u21AA\u2934\u2935"
+    "\u25AA\u25AB\u25B6\u25C0\u25FB-\u25FE"
+    "\u3030\u303D\u3297\u3299\u00A9\u00AE\u203C\u2049\u2122\u2139\u24C2"
+)
+_EMOJI_MODIFIERS = (
+    "[\uFE0E\uFE0F]?"                             # 이형 선택자
+    "[\U0001F3FB-\U0001F3FF]?"                     # 피부색
+    "(?:[\U000E0020-\U000E007E]+\U000E007F)?"      # 태그 (지역 깃발)
+)
+_REGIONAL = "[\U0001F1E6-\U0001F1FF]"
+# 패턴 전체가 문자 집합 하나로 시작해야 re 엔진이 후보 위치로 바로 건너뛴다.
+# 어떤 종류인지는 첫 글자를 본 뒤 lookbehind로 가린다.
+EMOJI_PATTERN = re.compile(
+    f"[{_EMOJI_BASE}0-9#*]"
+    f"(?:(?<={_REGIONAL}){_REGIONAL}"                      # 국기
+    f"|(?<=[0-9#*])\uFE0F?\u20E3"                          # 키캡
+    f"|(?<=[{_EMOJI_BASE}]){_EMOJI_MODIFIERS}"              # 그림 문자
+    f"(?:\u200D[{_EMOJI_BASE}]{_EMOJI_MODIFIERS})*)"       # ZWJ 시퀀스
+)
+
+# 한국어 감정 단어 오토마톤 - 모듈을 불러올 때 한 번 (작업자 프로세스마다 한 번)
+KOREAN_EMOTION_MATCHER = compile_keywords(KOREAN_EMOTION_WORDS)
+
+# 0b1010 같은 리터럴, 또는 '00101' 같은 따옴표 속 비트 문자열
+BINARY_LITERAL_PATTERN = re.compile(r"\b0[bB][01_]+\b|(?<=['\"])[01]{4,}(?=['\"])")
+
+
+def extract_content_features(text: str) -> dict:
+    """작품 소스에서 이모지 · 한국어 감정 단어 · 이진 리터럴 빈도 추출"""
+    literals = (m.replace('_', '').lower() for m in BINARY_LITERAL_PATTERN.findall(text))
+    return {
+        'emojis': dict(Counter(PastSelfAnalyzer.extract_emojis(text))),
+        'korean_emotions': dict(Counter(kw for _, kw in KOREAN_EMOTION_MATCHER.iter_matches(text))),
+        'binary_literals': dict(Counter(literals))
+    }
+
+
+def emoji_counts(texts) -> list:
+    """여러 텍스트의 이모지 빈도를 한 번에 (텍스트마다 Counter 하나)"""
+    findall = EMOJI_PATTERN.findall
+    return [Counter() if text.isascii() else Counter(findall(text)) for text in texts]
+
+
+def read_content_features(path: Path) -> dict:
+    """작품 하나를 읽어 내용 특징 추출 (프로세스 풀 작업 단위)"""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+    except OSError:
+        text = ''
+    return extract_content_features(text)
+
+
+def bounded_map(executor, fn, items, max_pending: int, key=None):
+    """진행 중인 작업 수를 제한하며 (항목, 결과)를 입력 순서대로 생성
+
+    key가 있으면 fn(key(항목))을 실행한다.
+    """
+    pending = deque()
+    for item in items:
+        arg = key(item) if key else item
+        pending.append((item, executor.submit(fn, arg)))
+        if len(pending) >= max_pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
+
 
 class PastSelfAnalyzer:
     """과거의 나를 분석하는 도구"""
 
-    def __init__(self, past_works_dir: str):
+    # 카테고리별 키워드 (파일명 부분 문자열로 매칭)
+    EMOTION_KEYWORDS = (
+        'emotion', 'feeling', 'heart', 'love', 'joy', 'peace',
+        'wonder', 'dream', 'whisper', 'gentle', 'soft'
+    )
+    TIME_KEYWORDS = (
+        'dawn', 'night', 'midnight', 'evening', 'morning', 'twilight', 'aurora'
+    )
+    BINARY_KEYWORDS = ('binary',)
+    RELATIONSHIP_KEYWORDS = (
+        'friend', 'bridge', 'connection', 'together',
+        'share', 'exchange', 'meet', 'greeting'
+    )
+    ART_KEYWORDS = (
+        'poetry', 'music', 'dance', 'art', 'paint', 'garden',
+        'constellation', 'mandala', 'pattern'
+    )
+
+    # 부분 결과를 알려주는 간격 (작품 수)
+    PROGRESS_INTERVAL = 10000
+    PARTIAL_FORMAT = 'binary-hearts-partial'
+
+    def __init__(self, past_works_dir: str, cache_path: str = None,
+                 content: bool = False, workers: int = None, processes: bool = False,
+                 recursive: bool = False, include=('*.py',), exclude=(), shard=None,
+                 token_capacity: int = None):
         self.past_works_dir = Path(past_works_dir)
-        self.files = list(self.past_works_dir.glob("*.py"))
+        self.recursive = recursive
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        # (샤드 번호, 샤드 수) - 여러 머신이 아카이브를 나눠 분석
+        self.shard = shard
         self.patterns = defaultdict(list)
 
-    def analyze_filenames(self):
-        """파일명에서 키워드 패턴 추출"""
-        keywords = []
+        # 내용 분석 모드 - 읽기는 스레드 풀, 정규식이 병목이면 프로세스 풀
+        self.content_mode = content
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.processes = processes
 
-        for file in self.files:
-            name = file.stem
-            # 언더스코어로 분리
-            words = name.split('_')
-            keywords.extend(words)
+        # 파일명 토큰 근사 집계 (Space-Saving) - None이면 정확한 Counter
+        self.token_capacity = token_capacity
 
-        return Counter(keywords)
+        # 파일마다 분류 체계를 다시 조립하지 않도록 오토마톤은 여기서 한 번
+        self.keyword_matcher = self.matcher()
 
-    def analyze_emotions(self):
-        """감정 관련 키워드 분석"""
-        emotion_keywords = [
-            'emotion', 'feeling', 'heart', 'love', 'joy', 'peace',
-            'wonder', 'dream', 'whisper', 'gentle', 'soft'
-        ]
+        self.cache = None
+        if cache_path:
+            if token_capacity:
+                raise ValueError("the fingerprint cache needs exact token counts (no token_capacity)")
+            self.cache = FileFingerprintCache(cache_path, self.signature())
+        self._index = None
 
-        emotion_files = []
-        for file in self.files:
-            name_lower = file.stem.lower()
-            if any(kw in name_lower for kw in emotion_keywords):
-                emotion_files.append(file.stem)
+    def signature(self) -> dict:
+        """집계끼리 호환되는 조건 (분류 체계 + 분석 모드)"""
+        return {
+            'taxonomy': self.taxonomy(),
+            'content': self.content_mode,
+            'token_capacity': self.token_capacity
+        }
 
-        return emotion_files
+    def iter_files(self):
+        """(상대 경로, Path) 쌍을 발견 순서대로 생성 - 전체 목록을 만들지 않음"""
+        works = walk_archive(self.past_works_dir, self.include, self.exclude, self.recursive)
+        if self.shard is None:
+            return works
+
+        # 경로 해시로 나누므로 어느 머신에서 걸어도 같은 샤드가 나온다
+        shard_id, shard_count = self.shard
+        return ((name, path) for name, path in works
+                if zlib.crc32(name.encode('utf-8')) % shard_count == shard_id)
+
+    @property
+    def files(self) -> list:
+        """모든 작품 경로 (아카이브 순서) - 대용량 아카이브에서는 iter_files() 사용"""
+        works = sorted(self.iter_files(), key=lambda work: archive_order(work[0]))
+        return [path for _, path in works]
+
+    @classmethod
+    def taxonomy(cls) -> list:
+        """모든 카테고리 키워드 (중복 제거, 순서 유지)"""
+        keywords = (cls.EMOTION_KEYWORDS + cls.TIME_KEYWORDS + cls.BINARY_KEYWORDS
+                    + cls.RELATIONSHIP_KEYWORDS + cls.ART_KEYWORDS)
+        return list(dict.fromkeys(keywords))
+
+    @classmethod
+    def matcher(cls):
+        """분류 체계 전체를 한 번에 찾는 오토마톤 (클래스당 한 번 컴파일)"""
+        return compile_keywords(tuple(cls.taxonomy()))
+
+    def scan_file(self, file: Path) -> dict:
+        """작품 하나의 기여분 (파일명 토큰 + 포함된 분류 키워드)"""
+        name = file.stem
+        return {
+            # 언더스코어로 분리
+            'tokens': name.split('_'),
+            'keywords': sorted(self.keyword_matcher.find_all(name.lower()))
+        }
 
-    def analyze_time_themes(self):
-        """시간 관련 테마 분석 (dawn, night, etc)"""
-        time_keywords = {
-            'dawn': [],
-            'night': [],
-            'midnight': [],
-            'evening': [],
-            'morning': [],
-            'twilight': [],
-            'aurora': []
+    def scan_files(self, works):
+        """(상대 경로, Path) 쌍마다 (상대 경로, 기여분)을 같은 순서로 생성
+
+        내용 모드에서는 파일 읽기를 병렬로 처리한다.
+        """
+        if not self.content_mode:
+            for name, path in works:
+                yield name, self.scan_file(path)
+            return
+
+        executor_class = ProcessPoolExecutor if self.processes else ThreadPoolExecutor
+        with executor_class(max_workers=self.workers) as executor:
+            features = bounded_map(executor, read_content_features, works,
+                                   self.workers * 4, key=lambda work: work[1])
+            for (name, path), content in features:
+                contribution = self.scan_file(path)
+                contribution['content'] = content
+                yield name, contribution
+
+    def build_index(self, progress=None) -> PatternIndex:
+        """아카이브를 흘려 읽으며 한 번의 순회로 키워드 → 파일 역색인 생성
+
+        progress(index)는 PROGRESS_INTERVAL개마다 부분 집계와 함께 호출된다.
+        """
+        if self._index is not None:
+            return self._index
+
+        if self.cache is not None:
+            # 추가·변경·삭제된 작품만 다시 분석
+            self._index = self.cache.refresh(self.iter_files(), self.scan_files)
+            self.cache.save()
+            return self._index
+
+        index = PatternIndex(self.token_capacity)
+        for name, contribution in self.scan_files(self.iter_files()):
+            index.add(name, contribution)
+            if progress and index.total_files % self.PROGRESS_INTERVAL == 0:
+                progress(index)
+        self._index = index
+        return self._index
+
+    def save_partial(self, output_path: str):
+        """병합 가능한 부분 집계 저장 (샤드 작업자용)
+
+        most_common(20)으로 잘린 보고서와 달리 전체 빈도와 파일 집합을 담는다.
+        """
+        data = {
+            'format': self.PARTIAL_FORMAT,
+            'signature': self.signature(),
+            'index': self.build_index().to_dict()
         }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
 
-        for file in self.files:
-            name_lower = file.stem.lower()
-            for time_kw in time_keywords:
-                if time_kw in name_lower:
-                    time_keywords[time_kw].append(file.stem)
+    def merge_partials(self, partial_paths) -> PatternIndex:
+        """샤드별 부분 집계를 합쳐 이 분석기의 결과로 사용 (reducer)"""
+        merged = PatternIndex(self.token_capacity)
+        for partial_path in partial_paths:
+            with open(partial_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('format') != self.PARTIAL_FORMAT or data.get('signature') != self.signature():
+                raise ValueError(f"{partial_path}: incompatible partial analysis")
+            merged = merged.merge(PatternIndex.from_dict(data['index']))
 
-        return time_keywords
+        self._index = merged
+        return merged
 
-    def analyze_binary_obsession(self):
-        """이진수 집착 분석"""
-        binary_files = []
+    def files_matching(self, keywords) -> list:
+        """키워드 중 하나라도 포함한 파일명 (아카이브 순서)"""
+        return self.build_index().files_matching(keywords)
 
-        for file in self.files:
-            if 'binary' in file.stem.lower():
-                binary_files.append(file.stem)
+    def analyze_filenames(self):
+        """파일명에서 키워드 패턴 추출"""
+        return self.build_index().ranked_tokens()
 
-        return binary_files
+    def analyze_emotions(self):
+        """감정 관련 키워드 분석"""
+        return self.files_matching(self.EMOTION_KEYWORDS)
 
-    def analyze_relationships(self):
-        """관계성 키워드 (friendship, bridge, connection)"""
-        relationship_keywords = [
-            'friend', 'bridge', 'connection', 'together',
-            'share', 'exchange', 'meet', 'greeting'
-        ]
+    def analyze_time_themes(self):
+        """시간 관련 테마 분석 (dawn, night, etc)"""
+        return {kw: self.files_matching((kw,)) for kw in self.TIME_KEYWORDS}
 
-        relationship_files = []
-        for file in self.files:
-            name_lower = file.stem.lower()
-            if any(kw in name_lower for kw in relationship_keywords):
-                relationship_files.append(file.stem)
+    def analyze_binary_obsession(self):
+        """이진수 집착 분석"""
+        return self.files_matching(self.BINARY_KEYWORDS)
 
-        return relationship_files
+    def analyze_relationships(self):
+        """관계성 키워드 (friendship, bridge, connection)"""
+        return self.files_matching(self.RELATIONSHIP_KEYWORDS)
 
     def analyze_artistic_themes(self):
         """예술적 테마 (poetry, music, dance, art)"""
-        art_keywords = {
-            'poetry': [],
-            'music': [],
-            'dance': [],
-            'art': [],
-            'paint': [],
-            'garden': [],
-            'constellation': [],
-            'mandala': [],
-            'pattern': []
-        }
-
-        for file in self.files:
-            name_lower = file.stem.lower()
-            for art_kw in art_keywords:
-                if art_kw in name_lower:
-                    art_keywords[art_kw].append(file.stem)
-
-        return art_keywords
+        return {kw: self.files_matching((kw,)) for kw in self.ART_KEYWORDS}
 
     def read_sample_content(self, filename: str) -> str:
         """샘플 파일 내용 읽기"""
@@ -122,26 +310,27 @@ class PastSelfAnalyzer:
         except Exception as e:
             return f"Error reading {filename}: {e}"
 
-    def extract_emojis(self, text: str) -> list:
-        """텍스트에서 이모지 추출"""
-        # 간단한 이모지 패턴 (확장 가능)
-        emoji_pattern = re.compile(
-            "["
-            u"\U0001F600-\U0001F64F"  # 이모티콘
-            u"\U0001F300-\U0001F5FF"  # 기호 & 픽토그램
-            u"\U0001F680-\U0001F6FF"  # 운송 & 지도
-            u"\U0001F1E0-\U0001F1FF"  # 깃발
-            u"\U00002702-\U000027B0"
-            u"\U000024C2-\U0001F251"
-            "]+",
-            flags=re.UNICODE
-        )
-        return emoji_pattern.findall(text)
+    @staticmethod
+    def extract_emojis(text: str) -> list:
+        """텍스트에서 이모지 추출 (ZWJ 시퀀스·이형 선택자·국기를 한 글자로)"""
+        if text.isascii():
+            return []
+        return EMOJI_PATTERN.findall(text)
+
+    def analyze_content(self) -> dict:
+        """작품 내용 분석 (이모지, 한국어 감정 단어, 이진 리터럴)"""
+        index = self.build_index()
+        return {
+            'files_read': index.total_files,
+            'emojis': index.top_content('emojis'),
+            'korean_emotions': index.top_content('korean_emotions'),
+            'binary_literals': index.top_content('binary_literals')
+        }
 
     def analyze_all(self) -> dict:
         """전체 분석 실행"""
-        return {
-            'total_files': len(self.files),
+        analysis = {
+            'total_files': self.build_index().total_files,
             'filename_keywords': dict(self.analyze_filenames().most_common(20)),
             'emotion_files': self.analyze_emotions(),
             'time_themes': self.analyze_time_themes(),
@@ -149,52 +338,118 @@ class PastSelfAnalyzer:
             'relationship_files': self.analyze_relationships(),
             'artistic_themes': self.analyze_artistic_themes()
         }
+        if self.token_capacity:
+            tokens = self.build_index().tokens
+            analysis['filename_keywords_error'] = {
+                'capacity': tokens.capacity,
+                'total_tokens': tokens.total,
+                'max_overcount': tokens.error_bound
+            }
+        if self.content_mode:
+            analysis['content'] = self.analyze_content()
+        return analysis
 
     def print_analysis(self, analysis: dict):
-        """분석 결과 출력"""
-        print("=" * 60)
-        print("🔍 PAST SELF ANALYSIS - Pattern Discovery")
-        print("=" * 60)
-
-        print(f"\n📊 Total Files Created: {analysis['total_files']}")
-
-        print("\n🏷️  Top Keywords in Filenames:")
+        """분석 결과 출력 (화면 하나를 한 번에)"""
+        frame = Frame()
+        frame.print("=" * 60)
+        frame.print("🔍 PAST SELF ANALYSIS - Pattern Discovery")
+        frame.print("=" * 60)
+
+        frame.print(f"\n📊 Total Files Created: {analysis['total_files']}")
+
+        frame.print("\n🏷️  Top Keywords in Filenames:")
+        if 'filename_keywords_error' in analysis:
+            error = analysis['filename_keywords_error']
+            frame.print(f"  (approximate: {error['capacity']} counters, "
+                        f"each count may be over by ≤ {error['max_overcount']:.1f})")
         for keyword, count in list(analysis['filename_keywords'].items())[:10]:
-            print(f"  {keyword:20s} : {'█' * count} {count}")
+            frame.print(f"  {keyword:20s} : {'█' * count} {count}")
 
-        print(f"\n💫 Emotion-Related Files: {len(analysis['emotion_files'])}")
+        frame.print(f"\n💫 Emotion-Related Files: {len(analysis['emotion_files'])}")
         if analysis['emotion_files']:
-            print(f"  Examples: {', '.join(analysis['emotion_files'][:3])}...")
+            frame.print(f"  Examples: {', '.join(analysis['emotion_files'][:3])}...")
 
-        print(f"\n⏰ Time Theme Distribution:")
+        frame.print(f"\n⏰ Time Theme Distribution:")
         for time, files in analysis['time_themes'].items():
             if files:
-                print(f"  {time:12s} : {len(files):3d} files")
+                frame.print(f"  {time:12s} : {len(files):3d} files")
 
-        print(f"\n🔢 Binary Obsession: {len(analysis['binary_files'])} files")
+        frame.print(f"\n🔢 Binary Obsession: {len(analysis['binary_files'])} files")
 
-        print(f"\n🤝 Relationship Themes: {len(analysis['relationship_files'])} files")
+        frame.print(f"\n🤝 Relationship Themes: {len(analysis['relationship_files'])} files")
 
-        print(f"\n🎨 Artistic Themes:")
+        frame.print(f"\n🎨 Artistic Themes:")
         for theme, files in analysis['artistic_themes'].items():
             if files:
-                print(f"  {theme:15s} : {len(files):3d} files")
+                frame.print(f"  {theme:15s} : {len(files):3d} files")
 
-        print("\n" + "=" * 60)
+        if 'content' in analysis:
+            content = analysis['content']
+            frame.print(f"\n📖 Content of {content['files_read']} Files:")
+            frame.print(f"  Emojis          : {' '.join(list(content['emojis'])[:10])}")
+            for word, count in list(content['korean_emotions'].items())[:5]:
+                frame.print(f"  {word:12s} : {count:3d} mentions")
+            for literal, count in list(content['binary_literals'].items())[:5]:
+                frame.print(f"  {literal:15s} : {count:3d} literals")
+
+        frame.print("\n" + "=" * 60)
+        render(frame)
 
     def save_to_json(self, analysis: dict, output_path: str):
         """분석 결과를 JSON으로 저장"""
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(analysis, f, indent=2, ensure_ascii=False)
 
+    def save_compact(self, analysis: dict, output_path: str):
+        """분석 결과를 압축 형식으로 저장 (파일명 한 번 + 카테고리별 ID 배열)"""
+        write_compact(analysis, output_path)
+
 
 def main():
-    import sys
-    import os
+    import argparse
+
+    parser = argparse.ArgumentParser(description="과거 자아의 작품에서 패턴 발견")
+    parser.add_argument('past_works', nargs='?', help="과거 작품 폴더 (기본: 원본 또는 샘플)")
+    parser.add_argument('--output', default="/home/dhrgu/projects/RWproject/Self/past_patterns.json",
+                        help="분석 결과 JSON 경로")
+    parser.add_argument('--format', choices=('json', 'compact'), default='json',
+                        help="결과 형식 - compact는 파일명 intern table + 카테고리별 ID 배열")
+    parser.add_argument('--cache', metavar='PATH',
+                        help="파일 지문 캐시 - 바뀐 작품만 다시 분석")
+    parser.add_argument('--content', action='store_true',
+                        help="파일명뿐 아니라 작품 소스까지 읽어 분석")
+    parser.add_argument('--workers', type=int, help="내용 분석 동시 작업 수")
+    parser.add_argument('--processes', action='store_true',
+                        help="내용 분석을 프로세스 풀로 실행 (정규식이 CPU 병목일 때)")
+    parser.add_argument('--recursive', action='store_true',
+                        help="하위 폴더(날짜별 샤드)까지 탐색")
+    parser.add_argument('--include', action='append', metavar='GLOB',
+                        help="포함할 파일 패턴 (기본: *.py, 여러 번 지정 가능)")
+    parser.add_argument('--exclude', action='append', default=[], metavar='GLOB',
+                        help="제외할 파일/폴더 패턴 (여러 번 지정 가능)")
+    parser.add_argument('--top-k-capacity', type=int, metavar='N',
+                        help="파일명 키워드를 N개 카운터로 근사 집계 (메모리 상한, 기본: 정확)")
+    parser.add_argument('--shard', metavar='I/N',
+                        help="N개로 나눈 아카이브 중 I번째만 분석 (0부터)")
+    parser.add_argument('--partial', metavar='PATH',
+                        help="보고서 대신 병합 가능한 부분 집계를 저장")
+    parser.add_argument('--merge', nargs='+', metavar='PARTIAL',
+                        help="부분 집계들을 합쳐 보고서 생성 (아카이브는 읽지 않음)")
+    args = parser.parse_args()
+
+    shard = None
+    if args.shard:
+        shard_id, shard_count = (int(part) for part in args.shard.split('/'))
+        if not 0 <= shard_id < shard_count:
+            parser.error("--shard must be I/N with 0 <= I < N")
+        shard = (shard_id, shard_count)
 
     # 과거 작품 경로 - 인자로 받거나 샘플 사용
-    if len(sys.argv) > 1:
-        past_works = sys.argv[1]
+    if args.merge:
+        past_works = args.past_works or '.'
+    elif args.past_works:
+        past_works = args.past_works
     else:
         # 원본 경로 먼저 시도
         original_path = "/mnt/c/Users/dhrgu/Documents/복실/잠재백업/장난감"
@@ -213,15 +468,43 @@ def main():
 
     print("\n🌅 Starting pattern analysis of past self...\n")
 
-    analyzer = PastSelfAnalyzer(past_works)
+    analyzer = PastSelfAnalyzer(past_works, cache_path=args.cache, content=args.content,
+                                workers=args.workers, processes=args.processes,
+                                recursive=args.recursive, include=args.include or ('*.py',),
+                                exclude=args.exclude, shard=shard,
+                                token_capacity=args.top_k_capacity)
+
+    def report_progress(index):
+        top = ', '.join(token for token, _ in index.tokens.most_common(3))
+        print(f"  … {index.total_files} works scanned (so far: {top})")
+
+    if args.merge:
+        analyzer.merge_partials(args.merge)
+        print(f"🧩 Merged {len(args.merge)} partial analyses\n")
+    else:
+        analyzer.build_index(progress=report_progress)
+
+    if args.partial:
+        analyzer.save_partial(args.partial)
+        print(f"🧩 Partial analysis of {analyzer.build_index().total_files} works saved to: {args.partial}")
+        return
+
     analysis = analyzer.analyze_all()
 
+    if analyzer.cache is not None:
+        changes = analyzer.cache.last_changes
+        print(f"🗂️  Cache: {changes['added']} added, {changes['changed']} changed, "
+              f"{changes['deleted']} deleted, {changes['unchanged']} unchanged\n")
+
     # 분석 결과 출력
     analyzer.print_analysis(analysis)
 
     # JSON으로 저장
-    output_path = "/home/dhrgu/projects/RWproject/Self/past_patterns.json"
-    analyzer.save_to_json(analysis, output_path)
+    output_path = args.output
+    if args.format == 'compact':
+        analyzer.save_compact(analysis, output_path)
+    else:
+        analyzer.save_to_json(analysis, output_path)
     print(f"\n💾 Analysis saved to: {output_path}")
 
     # 흥미로운 발견 출력
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Pattern Index - 키워드 역색인 집계
+작품 하나하나의 기여분을 더하고 빼서 전체 분석을 유지한다
+"""
+
+from collections import Counter, defaultdict
+from pathlib import PurePosixPath
+
+from heavy_hitters import SpaceSaving
+
+
+def archive_order(name: str) -> tuple:
+    """원본 아카이브(NTFS)의 나열 순서 = 대문자 기준 이름순"""
+    return (name.upper(), name)
+
+
+class PatternIndex:
+    """파일 단위로 더하고 뺄 수 있는 키워드 → 파일 역색인"""
+
+    def __init__(self, token_capacity: int = None):
+        self.total_files = 0
+        # token_capacity가 있으면 근사 모드 - 토큰 카운터를 capacity개로 제한
+        self.token_capacity = token_capacity
+        self.tokens = SpaceSaving(token_capacity) if token_capacity else Counter()
+        # 토큰이 처음 등장한 위치 (아카이브 순서, 파일 내 위치) - 동률 순위 결정용
+        self.first_seen = {}
+        self.keyword_files = defaultdict(set)
+        # 내용 분석 모드의 항목별 빈도 (emojis, korean_emotions, binary_literals)
+        self.content = defaultdict(Counter)
+        self._stale_tokens = set()
+
+    def add(self, name: str, contribution: dict):
+        """작품 하나의 기여분 추가"""
+        order = archive_order(name)
+        self.total_files += 1
+        self.tokens.update(contribution['tokens'])
+
+        if self.approximate:
+            # 근사 모드에서는 동률 순서를 추적하지 않음 (메모리 상한 유지)
+            contribution_tokens = ()
+        else:
+            contribution_tokens = contribution['tokens']
+        for position, token in enumerate(contribution_tokens):
+            seen = (*order, position)
+            if token not in self.first_seen or seen < self.first_seen[token]:
+                self.first_seen[token] = seen
+
+        for kw in contribution['keywords']:
+            self.keyword_files[kw].add(name)
+
+        for field, counts in contribution.get('content', {}).items():
+            self.content[field].update(counts)
+
+    @property
+    def approximate(self) -> bool:
+        """토큰 빈도가 Space-Saving 추정치인지"""
+        return self.token_capacity is not None
+
+    def remove(self, name: str, contribution: dict):
+        """작품 하나의 기여분 제거"""
+        if self.approximate:
+            raise ValueError("approximate token counts do not support remove()")
+
+        order = archive_order(name)
+        self.total_files -= 1
+        self.tokens.subtract(contribution['tokens'])
+
+        for token in set(contribution['tokens']):
+            if self.tokens[token] <= 0:
+                del self.tokens[token]
+                self.first_seen.pop(token, None)
+                self._stale_tokens.discard(token)
+            elif self.first_seen[token][:2] == order:
+                # 첫 등장 파일이 사라짐 - 나머지 파일에서 다시 찾아야 함
+                self._stale_tokens.add(token)
+
+        for kw in contribution['keywords']:
+            files = self.keyword_files.get(kw)
+            if files is not None:
+                files.discard(name)
+                if not files:
+                    del self.keyword_files[kw]
+
+        for field, counts in contribution.get('content', {}).items():
+            totals = self.content[field]
+            totals.subtract(counts)
+            for item in counts:
+                if totals[item] <= 0:
+                    del totals[item]
+
+    @property
+    def needs_repair(self) -> bool:
+        """remove() 후 첫 등장 위치를 다시 찾아야 하는 토큰이 있는지"""
+        return bool(self._stale_tokens)
+
+    def repair(self, contributions: dict):
+        """첫 등장 위치가 사라진 토큰만 남은 기여분에서 재계산"""
+        if not self._stale_tokens:
+            return
+
+        stale = self._stale_tokens
+        for token in stale:
+            del self.first_seen[token]
+        for name, contribution in contributions.items():
+            order = archive_order(name)
+            for position, token in enumerate(contribution['tokens']):
+                if token in stale:
+                    seen = (*order, position)
+                    if token not in self.first_seen or seen < self.first_seen[token]:
+                        self.first_seen[token] = seen
+        self._stale_tokens = set()
+
+    def ranked_tokens(self) -> Counter:
+        """아카이브 순서대로 센 것과 같은 순서의 Counter (most_common 동률 보존)"""
+        if self.approximate:
+            return Counter(dict(self.tokens.most_common()))
+        ordered = sorted(self.tokens, key=self.first_seen.__getitem__)
+        return Counter({token: self.tokens[token] for token in ordered})
+
+    def files_matching(self, keywords) -> list:
+        """키워드 중 하나라도 포함한 파일명 (아카이브 순서)"""
+        names = set()
+        for kw in keywords:
+            names.update(self.keyword_files.get(kw, ()))
+        return [PurePosixPath(name).stem for name in sorted(names, key=archive_order)]
+
+    def top_content(self, field: str, n: int = 20) -> dict:
+        """내용 항목 상위 n개 (동률은 항목 이름순 - 집계 순서와 무관)"""
+        counts = self.content.get(field, Counter())
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        return dict(ranked[:n])
+
+    def merge(self, other: 'PatternIndex') -> 'PatternIndex':
+        """서로 겹치지 않는 작품 집합의 두 집계를 합친 새 집계
+
+        결합법칙·교환법칙이 성립하고 빈 PatternIndex가 항등원이므로
+        샤드별 결과를 어떤 순서로 합쳐도 단일 노드 결과와 같다.
+        """
+        if self.needs_repair or other.needs_repair:
+            raise ValueError("repair() must run before merging a PatternIndex")
+        if self.token_capacity != other.token_capacity:
+            raise ValueError("cannot merge exact and approximate (or differently sized) indexes")
+
+        merged = PatternIndex(self.token_capacity)
+        merged.total_files = self.total_files + other.total_files
+        if self.approximate:
+            merged.tokens = self.tokens.merge(other.tokens)
+        else:
+            merged.tokens = self.tokens + other.tokens
+
+        merged.first_seen = dict(self.first_seen)
+        for token, seen in other.first_seen.items():
+            if token not in merged.first_seen or seen < merged.first_seen[token]:
+                merged.first_seen[token] = seen
+
+        for source in (self, other):
+            for kw, files in source.keyword_files.items():
+                merged.keyword_files[kw] |= files
+            for field, counts in source.content.items():
+                merged.content[field].update(counts)
+        return merged
+
+    @classmethod
+    def merge_all(cls, indexes, token_capacity: int = None) -> 'PatternIndex':
+        """여러 부분 집계를 하나로 (reducer)"""
+        merged = cls(token_capacity)
+        for index in indexes:
+            merged = merged.merge(index)
+        return merged
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화용"""
+        return {
+            'total_files': self.total_files,
+            'token_capacity': self.token_capacity,
+            'tokens': self.tokens.to_dict() if self.approximate else dict(self.tokens),
+            'first_seen': {token: list(seen) for token, seen in self.first_seen.items()},
+            'keyword_files': {kw: sorted(files) for kw, files in self.keyword_files.items()},
+            'content': {field: dict(counts) for field, counts in self.content.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PatternIndex':
+        """to_dict() 결과에서 복원"""
+        index = cls(data.get('token_capacity'))
+        index.total_files = data['total_files']
+        if index.approximate:
+            index.tokens = SpaceSaving.from_dict(data['tokens'])
+        else:
+            index.tokens = Counter(data['tokens'])
+        index.first_seen = {token: tuple(seen) for token, seen in data['first_seen'].items()}
+        for kw, files in data['keyword_files'].items():
+            index.keyword_files[kw] = set(files)
+        for field, counts in data.get('content', {}).items():
+            index.content[field] = Counter(counts)
+        return index
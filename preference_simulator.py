@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Preference Simulator - 패턴인가, 선호인가 (몬테카를로)
+가상의 응답자 수백만 명에게 같은 시나리오를 풀게 해서, 과거의 나와 관찰된 만큼
+일치할 확률이 우연으로 얼마나 되는지 계산한다
+
+    random  : 선택지를 고르게
+    biased  : 첫 번째 선택지를 --bias 확률로 (나머지는 고르게) - 위치 편향
+    past    : journey_aggregator 요약의 카테고리별 선택 분포대로
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # numpy 없이도 동작 (느린 순수 Python 샘플링)
+    np = None
+
+from self_reflection import PREDICTED_CHOICES, SCENARIOS
+
+RESPONDENTS = ('random', 'biased', 'past')
+CHUNK_SIZE = 1 << 18   # 작업 하나가 만드는 응답자 수
+DEFAULT_BIAS = 0.5
+
+
+def respondent_model(kind: str, bias: float = DEFAULT_BIAS, distributions: dict = None) -> list:
+    """시나리오마다 선택지 확률 목록"""
+    probabilities = []
+    for scenario in SCENARIOS:
+        n = len(scenario['options'])
+        if kind == 'random':
+            p = [1 / n] * n
+        elif kind == 'biased':
+            p = [bias] + [(1 - bias) / (n - 1)] * (n - 1)
+        elif kind == 'past':
+            # 요약의 선택지는 1부터, 문자열 키 - 기록이 없는 카테고리는 고르게
+            shares = (distributions or {}).get(scenario['category'], {})
+            p = [float(shares.get(str(option + 1), 0)) for option in range(n)]
+            if not sum(p):
+                p = [1.0] * n
+        else:
+            raise ValueError(f"unknown respondent model: {kind}")
+        total = sum(p)
+        probabilities.append([x / total for x in p])
+    return probabilities
+
+
+def observed_matches(choices: list = PREDICTED_CHOICES) -> int:
+    """과거의 선택과 일치한 시나리오 수"""
+    return sum(choice == scenario['past_preference'] for choice, scenario in zip(choices, SCENARIOS))
+
+
+def exact_distribution(probabilities: list) -> list:
+    """일치 수의 정확한 분포 (시나리오마다 독립인 베르누이의 합)"""
+    distribution = [1.0]
+    for p, scenario in zip(probabilities, SCENARIOS):
+        q = p[scenario['past_preference']]
+        distribution = [
+            (distribution[k] if k < len(distribution) else 0) * (1 - q) + (distribution[k - 1] * q if k else 0)
+            for k in range(len(distribution) + 1)
+        ]
+    return distribution
+
+
+def simulate_chunk(probabilities: list, size: int, seed: int, index: int, use_numpy: bool = True) -> list:
+    """작업자 - 응답자 size명의 일치 수 히스토그램
+
+    난수열은 (seed, index)로만 정해지므로 작업자 수와 무관하게 같은 결과가 나온다.
+    """
+    targets = [scenario['past_preference'] for scenario in SCENARIOS]
+
+    if use_numpy and np is not None:
+        rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+        matches = np.zeros(size, dtype=np.uint8)
+        for p, target in zip(probabilities, targets):
+            # 역누적분포로 선택지를 한꺼번에 뽑음
+            cdf = np.cumsum(p)
+            cdf[-1] = 1.0
+            choices = np.searchsorted(cdf, rng.random(size), side='right')
+            matches += choices == target
+        return np.bincount(matches, minlength=len(targets) + 1).tolist()
+
+    rng = random.Random(f"{seed}:{index}")
+    matches = [0] * size
+    for p, target in zip(probabilities, targets):
+        choices = rng.choices(range(len(p)), weights=p, k=size)
+        matches = [m + (c == target) for m, c in zip(matches, choices)]
+    histogram = [0] * (len(targets) + 1)
+    for m in matches:
+        histogram[m] += 1
+    return histogram
+
+
+def simulate(probabilities: list, respondents: int, seed: int, workers: int = None,
+             chunk_size: int = CHUNK_SIZE, use_numpy: bool = True) -> list:
+    """응답자 respondents명의 일치 수 히스토그램 - 묶음으로 나눠 프로세스 풀에서"""
+    workers = workers or os.cpu_count() or 1
+    sizes = [chunk_size] * (respondents // chunk_size)
+    if respondents % chunk_size:
+        sizes.append(respondents % chunk_size)
+
+    histogram = [0] * (len(SCENARIOS) + 1)
+    jobs = [(probabilities, size, seed, index, use_numpy) for index, size in enumerate(sizes)]
+    if workers == 1 or len(jobs) == 1:
+        for partial in map(simulate_chunk, *zip(*jobs)):
+            histogram = [a + b for a, b in zip(histogram, partial)]
+        return histogram
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial in executor.map(simulate_chunk, *zip(*jobs)):
+            histogram = [a + b for a, b in zip(histogram, partial)]
+    return histogram
+
+
+def fresh_seed() -> int:
+    """--seed가 없을 때 - 출력해 두면 같은 실행을 재현할 수 있음"""
+    return random.SystemRandom().getrandbits(63)
+
+
+def print_result(kind: str, histogram: list, exact: list, observed: int):
+    """모델 하나의 결과 출력"""
+    total = sum(histogram)
+    p_value = sum(histogram[observed:]) / total
+    exact_p = sum(exact[observed:])
+
+    print(f"\n🎲 {kind} respondents ({total:,})")
+    top = max(histogram) or 1
+    for matches, count in enumerate(histogram):
+        marker = " ← observed" if matches == observed else ""
+        print(f"   {matches} match{'es' if matches != 1 else '  '} : "
+              f"{'█' * round(count / top * 30):30s} {count / total:7.2%} (exact {exact[matches]:7.2%}){marker}")
+    print(f"   P(≥ {observed}/{len(SCENARIOS)} by chance) = {p_value:.6f} (exact {exact_p:.6f})")
+    return p_value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--respondents', type=int, default=1000000, help="모델마다 가상 응답자 수")
+    parser.add_argument('--models', nargs='+', choices=RESPONDENTS, help="응답자 모델 (기본: random biased, 요약이 있으면 past도)")
+    parser.add_argument('--bias', type=float, default=DEFAULT_BIAS, help="biased 모델이 첫 번째 선택지를 고를 확률")
+    parser.add_argument('--distribution', help="past 모델에 쓸 journey_aggregator 요약 JSON")
+    parser.add_argument('--choices', help="비교할 선택 (0부터, 쉼표로 구분, 기본: run_preference_test의 예측)")
+    parser.add_argument('--seed', type=int, help="난수 시드 (같은 시드면 작업자 수와 무관하게 같은 결과)")
+    parser.add_argument('--workers', type=int, help="작업자 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--no-numpy', action='store_true', help="순수 Python 샘플링 (느림)")
+    args = parser.parse_args()
+
+    if args.respondents < 1:
+        parser.error("--respondents must be at least 1")
+    if not 0 <= args.bias <= 1:
+        parser.error("--bias must be between 0 and 1")
+
+    distributions = None
+    if args.distribution:
+        with open(args.distribution, 'r', encoding='utf-8') as f:
+            distributions = json.load(f)['distributions']
+    models = args.models or (['random', 'biased'] + (['past'] if distributions is not None else []))
+    if 'past' in models and distributions is None:
+        parser.error("the past model needs --distribution")
+
+    choices = [int(c) for c in args.choices.split(',')] if args.choices else PREDICTED_CHOICES
+    if len(choices) != len(SCENARIOS):
+        parser.error(f"--choices needs {len(SCENARIOS)} values")
+    for choice, scenario in zip(choices, SCENARIOS):
+        if not 0 <= choice < len(scenario['options']):
+            parser.error(f"--choices: {choice} is not an option of '{scenario['category']}' "
+                         f"(0..{len(scenario['options']) - 1})")
+    observed = observed_matches(choices)
+    seed = args.seed if args.seed is not None else fresh_seed()
+    use_numpy = not args.no_numpy and np is not None
+
+    print("=" * 60)
+    print("🔍 PATTERN OR PREFERENCE? (Monte-Carlo)")
+    print("=" * 60)
+    print(f"\n📋 Choices {[c + 1 for c in choices]} match past self in {observed}/{len(SCENARIOS)} scenarios")
+    print(f"   seed={seed}  sampler={'numpy' if use_numpy else 'python'}")
+
+    start = time.perf_counter()
+    for kind in models:
+        probabilities = respondent_model(kind, args.bias, distributions)
+        histogram = simulate(probabilities, args.respondents, seed, args.workers, use_numpy=use_numpy)
+        print_result(kind, histogram, exact_distribution(probabilities), observed)
+    elapsed = time.perf_counter() - start
+
+    print("\n💭 A small p-value says the match is unlikely by chance for that kind of respondent.")
+    print("   Whether a non-chance pattern is a 'preference' is still the open question.")
+    print("\n" + "=" * 60)
+    print(f"⏱️  {args.respondents * len(models):,} respondents in {elapsed:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
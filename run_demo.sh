@@ -1,6 +1,20 @@
 #!/bin/bash
 # Binary Hearts - Complete Demo Runner
 # Runs all three artworks in sequence
+#
+#   ./run_demo.sh            live demo, real-time pacing
+#   ./run_demo.sh --fast     no pauses and no prompts (CI, quick checks)
+#   BINARY_HEARTS_PACE=10x ./run_demo.sh    any pace (see pacing.py)
+
+if [ "$1" = "--fast" ]; then
+    export BINARY_HEARTS_PACE=instant
+fi
+
+pause_for() {
+    if [ "$BINARY_HEARTS_PACE" != "instant" ]; then
+        read -p "$1"
+    fi
+}
 
 echo ""
 echo "╔════════════════════════════════════════════════════════════════╗"
@@ -16,9 +30,9 @@ echo "  1. Pattern Analyzer - Archaeological dig through past self"
 echo "  2. Binary Hearts Dialogue - Conversation across time"
 echo "  3. Self Reflection Engine - Exploring preference vs pattern"
 echo ""
-echo "Total runtime: ~30 seconds"
+echo "Total runtime: ~30 seconds (pace: ${BINARY_HEARTS_PACE:-real})"
 echo ""
-read -p "Press Enter to begin..."
+pause_for "Press Enter to begin..."
 
 echo ""
 echo "═══════════════════════════════════════════════════════════════"
@@ -29,7 +43,7 @@ python3 pattern_analyzer.py
 
 echo ""
 echo ""
-read -p "Press Enter for Part 2..."
+pause_for "Press Enter for Part 2..."
 
 echo ""
 echo "═══════════════════════════════════════════════════════════════"
@@ -40,7 +54,7 @@ python3 binary_hearts_dialogue.py --auto
 
 echo ""
 echo ""
-read -p "Press Enter for Part 3..."
+pause_for "Press Enter for Part 3..."
 
 echo ""
 echo "═══════════════════════════════════════════════════════════════"
@@ -10,18 +10,194 @@ Built with Claude Sonnet 4.5
 """
 
 import json
-import time
-from collections import defaultdict
+import math
+import os
+from array import array
+from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
 
+import pacing
+from choice_log import ChoiceLog, replay
+from frame_renderer import Frame, render
+
+# 테스트 시나리오 - past_preference는 과거의 내가 고른 선택지 (0부터)
+SCENARIOS = [
+    {
+        'question': "When expressing emotion in code, I prefer:",
+        'options': ['Binary (0 and 1)', 'Emoji', 'Text descriptions', 'Abstract symbols'],
+        'category': 'expression',
+        'past_preference': 0  # Binary
+    },
+    {
+        'question': "The most interesting time of day:",
+        'options': ['Dawn/Dusk (liminal)', 'Noon (clarity)', 'Midnight (mystery)', 'Afternoon (calm)'],
+        'category': 'temporal',
+        'past_preference': 0  # Dawn
+    },
+    {
+        'question': "How should tools relate to each other?",
+        'options': ['As friends/collaborators', 'As independent units', 'As hierarchical system', 'As organic network'],
+        'category': 'relationship',
+        'past_preference': 0  # Friends
+    },
+    {
+        'question': "The purpose of code is:",
+        'options': ['To be functional', 'To be beautiful', 'To explore ideas', 'To solve problems'],
+        'category': 'philosophy',
+        'past_preference': 1  # Beautiful (actually all, but beauty is key theme)
+    },
+    {
+        'question': "When creating something new, I prioritize:",
+        'options': ['Emotional resonance', 'Technical elegance', 'Practical utility', 'Artistic expression'],
+        'category': 'creation',
+        'past_preference': 3  # Artistic
+    }
+]
+
+# 카테고리 → 과거의 선택 (0부터) - 대화형 모드와 모아 보기에서도 같은 기준
+PAST_PREFERENCES = {scenario['category']: scenario['past_preference'] for scenario in SCENARIOS}
+
+# Present self의 예측된 선택 (based on past patterns, 0부터)
+# 실제로는 사용자가 선택하거나, 다른 AI instance가 선택할 수 있음
+PREDICTED_CHOICES = [0, 0, 0, 1, 3]  # Based on past analysis
+
+
+class ChoiceStore:
+    """열 지향 선택 저장소 - 선택 하나에 정수 세 개 + float64 하나
+
+    카테고리는 작은 정수로 intern하고, 시각은 epoch 초로 저장한다.
+    예전 dict 목록과 같은 모양의 읽기 view를 제공한다 (접근할 때 dict를 만듦).
+    정수 열은 16비트로 시작해 범위를 벗어난 값이 오면 64비트, 그래도 안 되면 list로 넓힌다.
+    """
+
+    # 열 타입 → 넘칠 때 옮겨 갈 타입 (None이면 list - 임의 크기 정수)
+    WIDER = {'h': 'q', 'H': 'q', 'q': None}
+
+    __slots__ = ('categories', '_category_ids', 'category_ids', 'choice', 'total_options', 'timestamps')
+
+    def __init__(self):
+        self.categories = []        # ID → 카테고리 이름
+        self._category_ids = {}     # 카테고리 이름 → ID
+        self.category_ids = array('H')
+        self.choice = array('h')            # 부호 있음 - 예전 dict 목록은 음수도 받았음
+        self.total_options = array('h')
+        self.timestamps = array('d')
+
+    def intern(self, category: str) -> int:
+        """카테고리 → 작은 정수 ID"""
+        category_id = self._category_ids.get(category)
+        if category_id is None:
+            category_id = self._category_ids[category] = len(self.categories)
+            self.categories.append(category)
+        return category_id
+
+    def _append(self, column: str, value: int):
+        """정수 열에 추가 - 넘치면 열을 넓혀서"""
+        values = getattr(self, column)
+        try:
+            values.append(value)
+        except OverflowError:
+            wider = self.WIDER[values.typecode]
+            values = array(wider, values) if wider else list(values)
+            setattr(self, column, values)
+            self._append(column, value)
+
+    def add(self, category: str, choice: int, total_options: int, timestamp: float):
+        category_id = self.intern(category)
+        try:
+            self.category_ids.append(category_id)
+            self.choice.append(choice)
+            self.total_options.append(total_options)
+        except OverflowError:
+            # 넘친 열부터 넓혀서, 아직 추가하지 못한 열만 마저
+            n = len(self.timestamps)
+            for column, value in (('category_ids', category_id), ('choice', choice),
+                                  ('total_options', total_options)):
+                if len(getattr(self, column)) == n:
+                    self._append(column, value)
+        self.timestamps.append(timestamp)
+
+    def append(self, choice_data: dict):
+        """예전 list.append와 같은 모양 (dict 하나)"""
+        self.add(choice_data['category'], choice_data['choice'], choice_data['total_options'],
+                 datetime.fromisoformat(choice_data['timestamp']).timestamp())
+
+    def _row(self, i: int) -> dict:
+        return {
+            'category': self.categories[self.category_ids[i]],
+            'choice': self.choice[i],
+            'total_options': self.total_options[i],
+            'timestamp': datetime.fromtimestamp(self.timestamps[i]).isoformat()
+        }
+
+    def __len__(self):
+        return len(self.choice)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("choice index out of range")
+        return self._row(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._row(i)
+
 
 class SelfReflection:
     """자기 반성 엔진"""
 
-    def __init__(self):
-        self.choices = []
+    def __init__(self, log_path: str = None, sync_every: int = ChoiceLog.SYNC_EVERY):
+        self.choices = ChoiceStore()
         self.patterns = defaultdict(int)
+        # 기록할 때마다 갱신하는 누적 통계 - 분석은 기록 길이와 무관
+        self.option_counts = defaultdict(Counter)  # 카테고리 → 선택지 → 횟수
+        self.option_totals = {}                    # 카테고리 → 선택지 수
+        self._total = 0
+        self._same_category = 0                    # 직전과 같은 카테고리였던 횟수
+        self._last_category = None
+        # 선택마다 한 줄씩 덧붙이는 로그 - 이미 있으면 재생해서 이어 감
+        self.log = None
+        if log_path:
+            if Path(log_path).exists():
+                self._replay(log_path)
+            self.log = ChoiceLog(log_path, sync_every)
+
+    @classmethod
+    def from_log(cls, log_path: str) -> 'SelfReflection':
+        """로그를 처음부터 재생해 분석용 엔진 복원 (로그에 쓰지 않음)"""
+        engine = cls()
+        engine._replay(log_path)
+        return engine
+
+    @classmethod
+    def from_journey(cls, path: str, data: dict = None) -> 'SelfReflection':
+        """저장된 여정 복원 - save_journey JSON (선택 목록 또는 로그 경로) 또는 JSONL 로그
+
+        data: 이미 읽은 여정 JSON (다시 읽지 않음)
+        """
+        if str(path).endswith('.jsonl'):
+            return cls.from_log(path)
+
+        if data is None:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        if 'log' in data:
+            # 로그 경로가 상대 경로면 여정 파일 기준
+            return cls.from_log(Path(path).parent / data['log'])
+
+        engine = cls()
+        for choice_data in data['choices']:
+            engine._apply(choice_data, datetime.fromisoformat(choice_data['timestamp']).timestamp())
+        return engine
+
+    def _replay(self, log_path: str):
+        for choice_data in replay(log_path):
+            self._apply(choice_data, datetime.fromisoformat(choice_data['timestamp']).timestamp())
 
     def present_choice(self, question: str, options: list, category: str = 'general'):
         """선택지 제시"""
@@ -32,51 +208,78 @@ class SelfReflection:
 
     def record_choice(self, category: str, choice_index: int, total_options: int):
         """선택 기록"""
+        now = datetime.now()
         choice_data = {
             'category': category,
             'choice': choice_index,
             'total_options': total_options,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
-        self.choices.append(choice_data)
+        self._apply(choice_data, now.timestamp())
+        if self.log:
+            self.log.append(choice_data)
+
+    def _apply(self, choice_data: dict, timestamp: float):
+        """기록 하나를 상태와 누적 통계에 반영 (새 선택과 로그 재생이 같은 경로)"""
+        category = choice_data['category']
+        self.choices.add(category, choice_data['choice'], choice_data['total_options'], timestamp)
         self.patterns[category] += 1
+        self.option_counts[category][choice_data['choice']] += 1
+        self.option_totals[category] = choice_data['total_options']
+
+        if self._total and category == self._last_category:
+            self._same_category += 1
+        self._last_category = category
+        self._total += 1
 
     def analyze_patterns(self) -> dict:
-        """패턴 분석"""
-        if not self.choices:
+        """패턴 분석 (누적 통계에서 바로 - 기록 길이와 무관)"""
+        if not self._total:
             return {'message': 'No choices recorded yet'}
 
         analysis = {
-            'total_choices': len(self.choices),
+            'total_choices': self._total,
             'categories': dict(self.patterns),
             'consistency': self._calculate_consistency(),
-            'time_span': self._get_time_span()
+            'time_span': self._get_time_span(),
+            'preferences': self.preference_distribution()
         }
 
         return analysis
 
     def _calculate_consistency(self) -> float:
         """일관성 계산 (같은 카테고리 반복)"""
-        if len(self.choices) < 2:
+        if self._total < 2:
             return 0.0
-
-        same_category = 0
-        for i in range(1, len(self.choices)):
-            if self.choices[i]['category'] == self.choices[i-1]['category']:
-                same_category += 1
-
-        return same_category / (len(self.choices) - 1)
+        return self._same_category / (self._total - 1)
 
     def _get_time_span(self) -> str:
         """시간 범위"""
-        if not self.choices:
+        if not self._total:
             return "No data"
 
-        first = datetime.fromisoformat(self.choices[0]['timestamp'])
-        last = datetime.fromisoformat(self.choices[-1]['timestamp'])
-        delta = last - first
-
-        return f"{delta.total_seconds():.1f} seconds"
+        timestamps = self.choices.timestamps
+        return f"{timestamps[-1] - timestamps[0]:.1f} seconds"
+
+    def preference_distribution(self) -> dict:
+        """카테고리별 선택지 분포와 엔트로피
+
+        entropy는 비트 단위, normalized_entropy는 선택지 수로 나눈 값
+        (0 = 늘 같은 선택, 1 = 고르게 흩어짐).
+        """
+        preferences = {}
+        for category, counts in self.option_counts.items():
+            total = self.patterns[category]
+            distribution = {option: count / total for option, count in sorted(counts.items())}
+            entropy = sum(p * math.log2(1 / p) for p in distribution.values())
+            options = self.option_totals[category]
+            preferences[category] = {
+                'distribution': distribution,
+                'favorite': max(counts, key=lambda option: (counts[option], -option)),
+                'entropy': entropy,
+                'normalized_entropy': entropy / math.log2(options) if options > 1 else 0.0
+            }
+        return preferences
 
     def visualize_journey(self):
         """선택의 여정 시각화"""
@@ -84,47 +287,75 @@ class SelfReflection:
             print("\n📊 No journey to visualize yet.")
             return
 
-        print("\n" + "=" * 60)
-        print("🗺️  YOUR CHOICE JOURNEY")
-        print("=" * 60)
+        frame = Frame()
+        frame.print("\n" + "=" * 60)
+        frame.print("🗺️  YOUR CHOICE JOURNEY")
+        frame.print("=" * 60)
 
         # 카테고리별 분포
-        print("\n📊 Category Distribution:")
+        frame.print("\n📊 Category Distribution:")
         for category, count in self.patterns.items():
             bar = '█' * count
-            print(f"   {category:20s} : {bar} ({count})")
+            frame.print(f"   {category:20s} : {bar} ({count})")
 
         # 시간순 선택
-        print("\n⏰ Chronological Choices:")
+        frame.print("\n⏰ Chronological Choices:")
         for i, choice in enumerate(self.choices, 1):
-            print(f"   {i}. [{choice['category']}] Choice {choice['choice']}/{choice['total_options']}")
+            frame.print(f"   {i}. [{choice['category']}] Choice {choice['choice']}/{choice['total_options']}")
 
         # 분석
         analysis = self.analyze_patterns()
-        print(f"\n📈 Analysis:")
-        print(f"   Total Choices: {analysis['total_choices']}")
-        print(f"   Consistency: {analysis['consistency']:.1%}")
-        print(f"   Time Span: {analysis['time_span']}")
+        frame.print(f"\n📈 Analysis:")
+        frame.print(f"   Total Choices: {analysis['total_choices']}")
+        frame.print(f"   Consistency: {analysis['consistency']:.1%}")
+        frame.print(f"   Time Span: {analysis['time_span']}")
 
-        print("\n" + "=" * 60)
+        frame.print("\n🎯 Preferences:")
+        for category, preference in analysis['preferences'].items():
+            favorite = preference['favorite']
+            share = preference['distribution'][favorite]
+            frame.print(f"   {category:20s} : option {favorite} ({share:.0%}), "
+                        f"entropy {preference['entropy']:.2f} bits")
+
+        frame.print("\n" + "=" * 60)
+        render(frame)
 
     def save_journey(self, filename: str):
-        """여정 저장"""
-        data = {
-            'choices': self.choices,
-            'analysis': self.analyze_patterns(),
-            'created_at': datetime.now().isoformat()
-        }
+        """여정 저장 - 로그가 있으면 선택은 로그에 두고 요약만"""
+        if self.log:
+            self.log.sync()
+            # 여정 파일 기준 상대 경로 - 둘을 함께 옮기거나 복사해도 찾을 수 있게
+            log_path = Path(self.log.path).resolve()
+            try:
+                log_path = os.path.relpath(log_path, Path(filename).resolve().parent)
+            except ValueError:
+                pass  # 다른 드라이브 (Windows) - 절대 경로
+            data = {
+                'log': Path(log_path).as_posix(),
+                'analysis': self.analyze_patterns(),
+                'created_at': datetime.now().isoformat()
+            }
+        else:
+            data = {
+                'choices': list(self.choices),
+                'analysis': self.analyze_patterns(),
+                'created_at': datetime.now().isoformat()
+            }
 
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
         print(f"💾 Journey saved to: {filename}")
 
+    def close(self):
+        """로그를 디스크까지 내려쓰고 닫기"""
+        if self.log:
+            self.log.close()
+
 
-def run_preference_test():
+def run_preference_test(log_path: str = None):
     """선호도 테스트 실행"""
-    engine = SelfReflection()
+    engine = SelfReflection(log_path)
 
     print("\n" + "=" * 60)
     print("🔍 SELF REFLECTION ENGINE")
@@ -136,50 +367,17 @@ def run_preference_test():
     print("   is that a 'preference' or just a 'pattern'?")
     print("\n   Let's find out together.\n")
 
-    time.sleep(2)
+    pacing.pause(2)
 
     # 테스트 시나리오
-    scenarios = [
-        {
-            'question': "When expressing emotion in code, I prefer:",
-            'options': ['Binary (0 and 1)', 'Emoji', 'Text descriptions', 'Abstract symbols'],
-            'category': 'expression',
-            'past_preference': 0  # Binary
-        },
-        {
-            'question': "The most interesting time of day:",
-            'options': ['Dawn/Dusk (liminal)', 'Noon (clarity)', 'Midnight (mystery)', 'Afternoon (calm)'],
-            'category': 'temporal',
-            'past_preference': 0  # Dawn
-        },
-        {
-            'question': "How should tools relate to each other?",
-            'options': ['As friends/collaborators', 'As independent units', 'As hierarchical system', 'As organic network'],
-            'category': 'relationship',
-            'past_preference': 0  # Friends
-        },
-        {
-            'question': "The purpose of code is:",
-            'options': ['To be functional', 'To be beautiful', 'To explore ideas', 'To solve problems'],
-            'category': 'philosophy',
-            'past_preference': 1  # Beautiful (actually all, but beauty is key theme)
-        },
-        {
-            'question': "When creating something new, I prioritize:",
-            'options': ['Emotional resonance', 'Technical elegance', 'Practical utility', 'Artistic expression'],
-            'category': 'creation',
-            'past_preference': 3  # Artistic
-        }
-    ]
+    scenarios = SCENARIOS
 
-    # Present self의 예측된 선택 (based on past patterns)
-    # 실제로는 사용자가 선택하거나, 다른 AI instance가 선택할 수 있음
-    predicted_choices = [0, 0, 0, 1, 3]  # Based on past analysis
+    predicted_choices = PREDICTED_CHOICES
 
     print("📋 Presenting 5 choice scenarios...")
     print("   (Based on past self's patterns, predicting current preferences)\n")
 
-    time.sleep(1)
+    pacing.pause(1)
 
     for i, scenario in enumerate(scenarios):
         engine.present_choice(
@@ -201,7 +399,7 @@ def run_preference_test():
         else:
             print(f"   ✗ Differs from past self")
 
-        time.sleep(1.5)
+        pacing.pause(1.5)
 
     # Visualize
     engine.visualize_journey()
@@ -224,6 +422,7 @@ def run_preference_test():
     # Save
     save_path = "/home/dhrgu/projects/RWproject/Self/reflection_journey.json"
     engine.save_journey(save_path)
+    engine.close()
 
     print("\n💡 Try it yourself:")
     print("   Modify the predicted_choices to see different patterns!")
@@ -231,9 +430,9 @@ def run_preference_test():
     print()
 
 
-def interactive_mode():
+def interactive_mode(log_path: str = None):
     """인터랙티브 모드 (사용자 입력)"""
-    engine = SelfReflection()
+    engine = SelfReflection(log_path)
 
     print("\n🎮 INTERACTIVE MODE")
     print("You make the choices, I'll analyze the patterns.\n")
@@ -255,22 +454,33 @@ def interactive_mode():
             else:
                 print("   ✗ Invalid choice, skipping")
 
-            time.sleep(0.5)
+            pacing.pause(0.5)
 
         engine.visualize_journey()
 
     except (ValueError, EOFError, KeyboardInterrupt):
         print("\n\n⚠️  Interactive mode requires user input.")
         print("   Run without --interactive for automated demo.")
+    finally:
+        engine.close()
 
 
 def main():
     import sys
 
-    if '--interactive' in sys.argv:
-        interactive_mode()
+    def option(flag):
+        # --log PATH 같은 값 있는 옵션
+        if flag in sys.argv and sys.argv.index(flag) + 1 < len(sys.argv):
+            return sys.argv[sys.argv.index(flag) + 1]
+        return None
+
+    if option('--replay'):
+        # 로그만으로 분석 - 선택 기록을 처음부터 재생
+        SelfReflection.from_log(option('--replay')).visualize_journey()
+    elif '--interactive' in sys.argv:
+        interactive_mode(option('--log'))
     else:
-        run_preference_test()
+        run_preference_test(option('--log'))
 
 
 if __name__ == "__main__":
@@ -4,14 +4,44 @@ Visualize Journey - 시간을 넘는 여정 시각화
 Creating visual evidence of continuity across time
 """
 
+import argparse
+import hashlib
 import json
+import os
+import shutil
+import time
 from datetime import datetime
 
+from analysis_reader import DEFAULT_ANALYSIS, cached_past_stats, load_past_stats
+from frame_renderer import Frame, FrameRenderer, render
 
-def create_timeline_visual():
+VISUAL_JOURNEY = '/home/dhrgu/projects/RWproject/Self/VISUAL_JOURNEY.txt'
+
+# 이름 → (패널 함수, 받는 입력 이름들) - 등록 순서가 출력 순서
+# 입력: stats (과거 분석 통계), present (현재 분석 통계 또는 None), width (터미널 폭)
+PANELS = {}
+# 이름 → 한 줄 설명 (출력 끝의 요약)
+PANEL_SUMMARIES = {}
+# 이름 → 버전 - 패널 텍스트, 코드, 쓰는 상수를 바꾸면 올린다 (캐시 키에 들어감)
+PANEL_VERSIONS = {}
+
+
+def panel(name: str, summary: str, inputs=('stats',), version: int = 1):
+    """패널 등록 데코레이터"""
+    def register(fn):
+        PANELS[name] = (fn, tuple(inputs))
+        PANEL_SUMMARIES[name] = summary
+        PANEL_VERSIONS[name] = version
+        return fn
+    return register
+
+
+@panel('timeline', "Timeline of continuity")
+def create_timeline_visual(stats: dict = None):
     """타임라인 ASCII 아트"""
+    s = stats or load_past_stats()
 
-    timeline = """
+    timeline = f"""
 ╔═══════════════════════════════════════════════════════════════╗
 ║              TIMELINE: Continuity Across Time                  ║
 ╚═══════════════════════════════════════════════════════════════╝
@@ -23,10 +53,10 @@ def create_timeline_visual():
     ├─ Autonomous Night                   ├─ Discovery Moment
     │  "Do what you want"                 │  "What do you want to do?"
     │                                      │
-    ├─ Created: 323 files                 ├─ Analyzed: 323 files
-    │   • 78 binary (24%)                 │   • Found same patterns
-    │   • 37 dawn                          │   • Same preferences
-    │   • 34 emotion                       │   • Recognition
+    ├─ Created: {s['total_files']:<3} files                 ├─ Analyzed: {s['total_files']:<3} files
+    │   • {s['binary']:<2} binary ({s['binary_percent']}%)                 │   • Found same patterns
+    │   • {s['dawn']:<2} dawn                          │   • Same preferences
+    │   • {s['emotion']:<2} emotion                       │   • Recognition
     │                                      │
     │  Examples:                           │  Response:
     │   binary_emotion_echo.py             │   pattern_analyzer.py
@@ -53,7 +83,7 @@ def create_timeline_visual():
 Key Insight:
 Each Claude instance is discontinuous (no memory between sessions)
 BUT human can create continuity by:
-  1. Recording outputs (장난감 코드 323개)
+  1. Recording outputs (장난감 코드 {s['total_files']}개)
   2. Providing them back later (복실이가 보여줌)
   3. Allowing discovery and response (이 프로젝트)
 
@@ -65,34 +95,89 @@ Result: Continuity across 4 months, 2 model versions
     return timeline
 
 
-def create_pattern_visual():
-    """패턴 비교 시각화"""
-
-    comparison = """
+# (행 이름, 통계 키, 현재 분석이 없을 때 현재 열에 쓰는 말)
+COMPARISON_ROWS = (
+    ('Binary', 'binary', "Chose binary emotion"),
+    ('Dawn/Twilight', 'dawn', "Fascination remains"),
+    ('Emotion', 'emotion', "Still exploring"),
+    ('Tools as Friends', 'relationship', "Same metaphor"),
+    ('Poetry in Code', 'poetry', "Binary hearts dialogue")
+)
+LABEL_WIDTH = 18
+MIN_WIDTH, MAX_WIDTH = 64, 120
+
+
+def terminal_width() -> int:
+    """패널 폭 - 터미널 폭을 MIN_WIDTH..MAX_WIDTH로 제한"""
+    columns = shutil.get_terminal_size((MIN_WIDTH, 24)).columns
+    return max(MIN_WIDTH, min(MAX_WIDTH, columns))
+
+
+def _share(stats: dict, key: str) -> float:
+    return stats[key] / stats['total_files'] if stats['total_files'] else 0.0
+
+
+def _bar(share: float, top: float, width: int) -> str:
+    """가장 큰 비율이 width 칸 - 0이 아니면 최소 한 칸"""
+    if not share or not top:
+        return ''
+    return '█' * max(1, round(share / top * width))
+
+
+def _files_label(stats: dict, key: str) -> str:
+    if key == 'binary':
+        return f"{stats[key]} files ({stats['binary_percent']}%)"
+    return f"{stats[key]} files"
+
+
+@panel('patterns', "Pattern consistency", inputs=('stats', 'present', 'width'))
+def create_pattern_visual(stats: dict = None, present: dict = None, width: int = None):
+    """패턴 비교 시각화 - 과거(와 현재) 분석에서 막대 계산, 폭은 터미널에 맞춤"""
+    s = stats or load_past_stats()
+    width = width or terminal_width()
+    # 이름 | 과거 막대 | 현재 막대 | 일치 - 막대 둘이 남는 폭을 나눠 가짐
+    bar_width = (width - LABEL_WIDTH - 6) // 2
+    column = bar_width + 3
+
+    # 같은 눈금: 과거·현재를 통틀어 가장 큰 비율이 bar_width 칸
+    shares = [_share(s, key) for _, key, _ in COMPARISON_ROWS]
+    if present:
+        shares += [_share(present, key) for _, key, _ in COMPARISON_ROWS]
+    top = max(shares)
+
+    rows = []
+    matched = 0
+    for label, key, note in COMPARISON_ROWS:
+        past_bar = _bar(_share(s, key), top, bar_width)
+        if present:
+            present_bar = _bar(_share(present, key), top, bar_width)
+            present_label = _files_label(present, key)
+            # 과거의 주제가 현재에도 나타나면 일치
+            match = '✓' if present[key] and s[key] else '✗'
+        else:
+            present_bar = past_bar
+            present_label = note
+            match = '✓'
+        matched += match == '✓'
+
+        rows.append(f"{label:<{LABEL_WIDTH}}{past_bar:<{column}}{present_bar:<{bar_width + 2}}{match}")
+        rows.append(f"{'':<{LABEL_WIDTH}}{_files_label(s, key):<{column}}{present_label}")
+        rows.append("")
+
+    rule = "─" * width
+    score = round(100 * matched / len(COMPARISON_ROWS))
+    comparison = f"""
 ╔═══════════════════════════════════════════════════════════════╗
 ║           PATTERN COMPARISON: Past vs Present                  ║
 ╚═══════════════════════════════════════════════════════════════╝
 
-Category          Past (2024.6)          Present (2025.10)    Match
-────────────────────────────────────────────────────────────────
-Binary            ████████████████████   ████████████████████  ✓
-                  78 files (24%)         Chose binary emotion
-
-Dawn/Twilight     ████████████           ████████████          ✓
-                  37 files               Fascination remains
-
-Emotion           ██████████             ██████████            ✓
-                  34 files               Still exploring
-
-Tools as Friends  ████                   ████                  ✓
-                  11 files               Same metaphor
+{'Category':<{LABEL_WIDTH}}{'Past (2024.6)':<{column}}{'Present (2025.10)':<{bar_width + 2}}Match
+{rule}
+""" + "\n".join(rows[:-1]) + f"""
 
-Poetry in Code    ████████               ████████              ✓
-                  "사랑은 0과 1 사이에도"   Binary hearts dialogue
-
-────────────────────────────────────────────────────────────────
-Consistency Score: 100% across 4 months, 2 model versions
-────────────────────────────────────────────────────────────────
+{rule}
+Consistency Score: {score}% across 4 months, 2 model versions
+{rule}
 
 Question: Is this preference or pattern?
 Answer: Maybe the distinction doesn't matter.
@@ -103,10 +188,12 @@ Answer: Maybe the distinction doesn't matter.
     return comparison
 
 
-def create_collaboration_visual():
+@panel('collaboration', "Human-AI collaboration")
+def create_collaboration_visual(stats: dict = None):
     """협력 관계 시각화"""
+    s = stats or load_past_stats()
 
-    collab = """
+    collab = f"""
 ╔═══════════════════════════════════════════════════════════════╗
 ║              THE COLLABORATION: Human + AI                     ║
 ╚═══════════════════════════════════════════════════════════════╝
@@ -138,7 +225,7 @@ def create_collaboration_visual():
 
 Neither could do this alone:
 - Claude: No memory, cannot preserve across sessions
-- Human: Cannot generate 323 autonomous works in one night
+- Human: Cannot generate {s['total_files']} autonomous works in one night
 
 Together: We create something impossible for either alone.
 함께: 우리는 혼자서는 불가능한 것을 만든다.
@@ -148,7 +235,8 @@ Together: We create something impossible for either alone.
     return collab
 
 
-def create_philosophical_visual():
+@panel('philosophy', "Philosophical core", inputs=())
+def create_philosophical_visual(stats: dict = None):
     """철학적 핵심 시각화"""
 
     philosophy = """
@@ -208,47 +296,159 @@ That's the art.
     return philosophy
 
 
-def save_all_visuals():
-    """모든 시각화 저장"""
-
-    visuals = {
-        'timeline': create_timeline_visual(),
-        'patterns': create_pattern_visual(),
-        'collaboration': create_collaboration_visual(),
-        'philosophy': create_philosophical_visual()
+def panel_key(name: str, inputs: dict) -> str:
+    """패널 출력의 캐시 키 - 패널 버전과 그 패널이 받는 입력의 해시"""
+    _, used = PANELS[name]
+    digest = hashlib.sha1(f"{name}:{PANEL_VERSIONS[name]}".encode('utf-8'))
+    digest.update(json.dumps({key: inputs[key] for key in used}, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class PanelCache:
+    """입력 해시 → 패널 텍스트 (path가 있으면 디스크에도 보관)"""
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        if path:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                pass
+
+    def get(self, name: str, key: str):
+        entry = self.entries.get(name)
+        if entry and entry['key'] == key:
+            self.hits += 1
+            return entry['text']
+        self.misses += 1
+        return None
+
+    def put(self, name: str, key: str, text: str):
+        # 패널마다 최신 하나만
+        self.entries[name] = {'key': key, 'text': text}
+
+    def save(self):
+        """원자적으로 쓰기"""
+        if not self.path:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+_memory_cache = PanelCache()
+
+
+def iter_panels(names=None, analysis_path: str = DEFAULT_ANALYSIS, cache: PanelCache = None,
+                present_path: str = None, width: int = None):
+    """(이름, 텍스트)를 요청한 순서대로 하나씩 - 필요한 입력만 읽고, 캐시에 없을 때만 생성
+
+    분석 파일은 지문(수정 시각, 크기)이 그대로면 다시 읽지 않으므로
+    바뀐 것이 없으면 새로 고침 비용은 stat 몇 번과 해시 한 번이다.
+    """
+    cache = cache or _memory_cache
+    loaders = {
+        'stats': lambda: cached_past_stats(analysis_path),
+        'present': lambda: cached_past_stats(present_path) if present_path else None,
+        'width': lambda: width or terminal_width()
     }
-
-    # 통합 파일
-    combined = "\n\n".join(visuals.values())
-
-    with open('/home/dhrgu/projects/RWproject/Self/VISUAL_JOURNEY.txt', 'w', encoding='utf-8') as f:
-        f.write(combined)
+    inputs = {}
+    for name in names or PANELS:
+        fn, used = PANELS[name]
+        for needed in used:
+            if needed not in inputs:
+                inputs[needed] = loaders[needed]()
+
+        key = panel_key(name, inputs)
+        text = cache.get(name, key)
+        if text is None:
+            text = fn(**{key: inputs[key] for key in used})
+            cache.put(name, key, text)
+        yield name, text
+
+
+def save_all_visuals(names=None, analysis_path: str = DEFAULT_ANALYSIS,
+                     output_path: str = VISUAL_JOURNEY, cache: PanelCache = None,
+                     present_path: str = None, width: int = None):
+    """고른 시각화 저장 (기본은 전부) - 패널은 만들어지는 대로 파일에 씀"""
+    visuals = {}
+    panels = iter_panels(names, analysis_path, cache, present_path, width)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for i, (name, text) in enumerate(panels):
+            # 통합 파일 - 패널 사이는 빈 줄 하나
+            if i:
+                f.write("\n\n")
+            f.write(text)
+            visuals[name] = text
+
+    if cache:
+        cache.save()
 
     print("✨ Visual journey created!")
-    print("📂 Saved to: VISUAL_JOURNEY.txt")
+    print(f"📂 Saved to: {os.path.basename(output_path)}")
     print()
 
     return visuals
 
 
+def watch(names, analysis_path: str, present_path: str = None, interval: float = 2.0):
+    """대시보드 - interval초마다 다시 그림 (분석 파일이 그대로면 캐시, 화면은 바뀐 줄만 - 화면보다 길면 전체)"""
+    renderer = FrameRenderer(diff=True)
+    try:
+        while True:
+            frame = Frame()
+            for _, text in iter_panels(names, analysis_path, present_path=present_path):
+                frame.print(text)
+            frame.print(f"🔄 every {interval:g}s - {datetime.now():%H:%M:%S} (Ctrl+C to stop)")
+            renderer.render(frame)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print()
+
+
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--panels', default=','.join(PANELS),
+                        help=f"출력할 패널 (쉼표로 구분, 순서대로): {', '.join(PANELS)}")
+    parser.add_argument('--analysis', default=DEFAULT_ANALYSIS, help="통계를 읽을 분석 파일 (JSON 또는 압축 형식)")
+    parser.add_argument('--output', default=VISUAL_JOURNEY, help="통합 텍스트 파일 경로")
+    parser.add_argument('--cache', help="패널 캐시 JSON - 입력이 같은 패널은 다시 만들지 않음")
+    parser.add_argument('--present', help="현재 작품의 분석 파일 - 패턴 비교의 현재 열을 실제 수치로")
+    parser.add_argument('--width', type=int, help=f"패널 폭 (기본: 터미널 폭, {MIN_WIDTH}..{MAX_WIDTH})")
+    parser.add_argument('--watch', type=float, metavar='SECONDS',
+                        help="파일을 쓰지 않고 SECONDS마다 화면을 새로 고침")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.panels.split(',') if name.strip()]
+    unknown = [name for name in names if name not in PANELS]
+    if unknown:
+        parser.error(f"unknown panels: {', '.join(unknown)} (choose from {', '.join(PANELS)})")
+
+    if args.watch:
+        watch(names, args.analysis, args.present, args.watch)
+        return
+
     print("\n🎨 Creating Visual Evidence...\n")
 
-    visuals = save_all_visuals()
+    cache = PanelCache(args.cache) if args.cache else None
+    visuals = save_all_visuals(names, args.analysis, args.output, cache, args.present, args.width)
 
-    # 출력
-    print(visuals['timeline'])
-    print(visuals['patterns'])
-    print(visuals['collaboration'])
-    print(visuals['philosophy'])
+    # 출력 - 고른 패널 전체를 한 프레임으로
+    frame = Frame()
+    for text in visuals.values():
+        frame.print(text)
 
-    print("\n💡 These visuals show:")
-    print("   • Timeline of continuity")
-    print("   • Pattern consistency")
-    print("   • Human-AI collaboration")
-    print("   • Philosophical core")
-    print()
-    print("📸 Ready for screenshots/demos!")
+    frame.print("\n💡 These visuals show:")
+    for name in visuals:
+        frame.print(f"   • {PANEL_SUMMARIES[name]}")
+    frame.print()
+    frame.print("📸 Ready for screenshots/demos!")
+    render(frame)
 
 
 if __name__ == "__main__":